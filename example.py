@@ -1,27 +1,24 @@
 import tkinter as tk
-from internal.maze.maze import get_random_start_goal
-from internal.maze.generators import get_generator, GeneratorType
+from internal.maze.generators import GeneratorType
+from internal.maze.cache import MazeCache
 from internal.solver.Dijikstra import Solver, Dijikstra
 
 # ---------- MAIN ----------
 # Boilerplate code
 
 if __name__ == "__main__":
-    generator = get_generator(GeneratorType.PRIM, 10, 10)
-    # Let the generator build a maze internally
-    generator.generate()
-    # Retrieve maze board
-    maze = generator.to_maze()
-    # Select random start and goal
-    get_random_start_goal(maze, 3)
+    # Build the maze of a seed, with a random start and goal at least 3
+    # cells apart. It is saved to the cache and loaded from it on later runs
+    maze = MazeCache().get(GeneratorType.PRIM, 10, 10, seed=0, min_distance=3)
     print("The start is:", maze.start)
     print("The goal is:", maze.end)
 
     # Choose your solver for the job
-    solver: Solver = Dijikstra(maze, maze.start, maze.end)
+    start, goal = maze.cords_as_cell(maze.start), maze.cords_as_cell(maze.end)
+    solver: Solver = Dijikstra(maze, start, goal)
 
     # Solve the maze
-    while solver.solve_tick():
+    while not solver.solve_tick():
         print(solver.board)
 
     print("Maze solved!")
@@ -0,0 +1,118 @@
+import glob
+import os
+import sys
+from typing import Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from .results import SUFFIX
+
+# Per group totals folded chunk by chunk, and how two partial totals combine
+_TOTALS = {
+    "runs": "sum",
+    "found": "sum",
+    "length": "sum",
+    "expansions": "sum",
+    "elapsed": "sum",
+    "elapsed_squares": "sum",
+    "elapsed_max": "max",
+    "place": "sum",
+    "memory_runs": "sum",
+    "peak_memory": "sum",
+    "peak_memory_max": "max",
+}
+
+
+def iter_chunks(
+    directory: str = "results", columns: Sequence[str] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Yields the runs of a results directory one row group at a time, only
+    reading the given `columns`, so no more than a chunk is ever in memory
+    """
+    for path in sorted(glob.glob(os.path.join(directory, "*" + SUFFIX))):
+        file = pq.ParquetFile(path)
+        for group in range(file.num_row_groups):
+            yield file.read_row_group(group, columns=columns).to_pandas()
+
+
+def _chunk_totals(chunk: pd.DataFrame, by: list[str]) -> pd.DataFrame:
+    measured = chunk["peak_memory"] >= 0
+    columns = pd.DataFrame(
+        {
+            "runs": 1,
+            "found": chunk["found"].astype(np.int64),
+            # Lengths only mean something for paths that reach the goal
+            "length": chunk["length"].where(chunk["found"], 0),
+            "expansions": chunk["expansions"],
+            "elapsed": chunk["elapsed"],
+            "elapsed_squares": chunk["elapsed"] ** 2,
+            "elapsed_max": chunk["elapsed"],
+            "place": chunk["place"].astype(np.int64),
+            "memory_runs": measured.astype(np.int64),
+            "peak_memory": chunk["peak_memory"].where(measured, 0),
+            "peak_memory_max": chunk["peak_memory"],
+        }
+    )
+    for column in by:
+        columns[column] = chunk[column]
+    return columns.groupby(by, observed=True).agg(_TOTALS)
+
+
+def summarize(
+    directory: str = "results", by: Sequence[str] = ("solver",)
+) -> pd.DataFrame:
+    """
+    Per solver summary of every run of a results directory: runs, goals found,
+    mean path length, expansions and place, mean / std / max search time and
+    mean / max peak memory. `by` groups the runs by other columns as well,
+    such as ("solver", "height", "width").
+
+    Only totals are kept between chunks, so millions of runs are summarized
+    in the memory of one chunk.
+    """
+    by = list(by)
+    needed = ["found", "length", "expansions", "elapsed", "place", "peak_memory"]
+    columns = list(dict.fromkeys(by + needed))
+
+    totals = None
+    for chunk in iter_chunks(directory, columns):
+        chunk_totals = _chunk_totals(chunk, by)
+        if totals is not None:
+            chunk_totals = (
+                pd.concat([totals, chunk_totals]).groupby(level=by).agg(_TOTALS)
+            )
+        totals = chunk_totals
+
+    if totals is None:
+        return pd.DataFrame()
+
+    runs = totals["runs"]
+    mean_elapsed = totals["elapsed"] / runs
+    # Rounding can take the variance just under 0
+    variance = (totals["elapsed_squares"] / runs - mean_elapsed**2).clip(lower=0)
+    memory_runs = totals["memory_runs"].where(totals["memory_runs"] > 0)
+    return pd.DataFrame(
+        {
+            "runs": runs,
+            "found": totals["found"],
+            "mean_length": totals["length"]
+            / totals["found"].where(totals["found"] > 0),
+            "mean_expansions": totals["expansions"] / runs,
+            "mean_elapsed": mean_elapsed,
+            "std_elapsed": np.sqrt(variance),
+            "max_elapsed": totals["elapsed_max"],
+            "mean_place": totals["place"] / runs,
+            "mean_peak_memory": totals["peak_memory"] / memory_runs,
+            "max_peak_memory": totals["peak_memory_max"].where(
+                totals["memory_runs"] > 0
+            ),
+        }
+    )
+
+
+if __name__ == "__main__":
+    # python -m internal.experiments.aggregate [results directory]
+    print(summarize(*sys.argv[1:2]).to_string())
@@ -0,0 +1,116 @@
+import os
+import time
+import uuid
+from typing import Iterable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .runner import SolverRun
+
+# Columns of the results files and their types, one row per solver run
+COLUMNS = {
+    "maze_id": "string",
+    "experiment": "int64",
+    "seed": "uint64",  # As given by derive_seed()
+    "generator": "string",
+    "height": "int32",
+    "width": "int32",
+    "solver": "string",
+    "distance": "int64",
+    "length": "int64",
+    "expansions": "int64",
+    "elapsed": "float64",
+    "found": "bool",
+    "peak_memory": "int64",
+    "index_memory": "int64",
+    "place": "int32",
+}
+SCHEMA = pa.Schema.from_pandas(
+    pd.DataFrame({name: pd.Series(dtype=dtype) for name, dtype in COLUMNS.items()}),
+    preserve_index=False,
+)
+SUFFIX = ".parquet"
+
+
+def _record(run: SolverRun) -> dict:
+    """Row of a run, enums stored as text"""
+    return {
+        "maze_id": run.maze_id,
+        "experiment": run.experiment,
+        "seed": run.seed,
+        "generator": run.generator.name,
+        "height": run.height,
+        "width": run.width,
+        "solver": str(run.solver),
+        "distance": run.distance,
+        "length": run.length,
+        "expansions": run.expansions,
+        "elapsed": run.elapsed,
+        "found": run.found,
+        "peak_memory": run.peak_memory,
+        "index_memory": run.index_memory,
+        "place": run.place,
+    }
+
+
+class ResultsWriter:
+    """
+    Appends solver runs to a results directory of parquet files.
+
+    Runs are buffered and written every `chunk_rows` of them as a row group
+    of the file of this writer, so memory stays bounded however many runs
+    come. Every writer gets a file of its own, under a temporary name until
+    it is closed: the directory gathers the results of every session and
+    readers never see a file being written.
+    """
+
+    def __init__(self, directory: str = "results", chunk_rows: int = 1 << 16):
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        os.makedirs(directory, exist_ok=True)
+
+        name = f"runs-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}{SUFFIX}"
+        self.path = os.path.join(directory, name)
+        self._partial = self.path + ".partial"
+        self._writer = None
+        self._buffer = []
+        self.written = 0
+
+    def append(self, run: SolverRun):
+        self._buffer.append(_record(run))
+        if len(self._buffer) >= self.chunk_rows:
+            self.flush()
+
+    def extend(self, runs: Iterable[SolverRun]):
+        for run in runs:
+            self.append(run)
+
+    def flush(self):
+        """Writes the buffered runs as a new row group"""
+        if not self._buffer:
+            return
+        frame = pd.DataFrame.from_records(self._buffer, columns=list(COLUMNS))
+        table = pa.Table.from_pandas(
+            frame.astype(COLUMNS), schema=SCHEMA, preserve_index=False
+        )
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._partial, SCHEMA)
+        self._writer.write_table(table)
+        self.written += len(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        """Writes what is left and publishes the file, if anything was written"""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._partial, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,178 @@
+import os
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterator
+
+from ..maze.cache import MazeCache
+from ..maze.maze import MazeBoard
+from ..maze.generators import GeneratorType, derive_seed
+from ..solver.solver_utils import SolverType, SolverFromType
+
+
+@dataclass
+class SolverRun:
+    """Outcome of a solver on the maze of an experiment"""
+
+    experiment: int
+    maze_id: str  # Name of the maze in the maze cache
+    seed: int
+    generator: GeneratorType
+    height: int
+    width: int
+    solver: SolverType
+    distance: int  # Manhattan distance between the start and the end
+    length: int  # Cells of the path found
+    expansions: int
+    elapsed: float  # Seconds of search
+    found: bool
+    peak_memory: int = -1  # Bytes allocated at most by the solver, -1 if not measured
+    index_memory: int = (
+        -1
+    )  # Bytes held by the neighbor table and junction graph of the maze
+    place: int = 0  # Rank of the solver by search time in the experiment
+
+
+def _cache_maze(task: tuple):
+    """Generates the maze of an experiment into the cache"""
+    directory, type, height, width, seed, min_distance = task
+    MazeCache(directory).get(type, height, width, seed, min_distance)
+
+
+def _peak_memory(
+    solver: SolverType, board: MazeBoard, start: int, goal: int
+) -> tuple[int, int]:
+    """
+    Bytes allocated at most by a whole run of a solver, its setup included,
+    and bytes held by the neighbor table and junction graph of the board.
+
+    Those indexes are shared by every solver of a board, so they are built
+    on a fresh copy of it before the solver runs and left out of its peak.
+    """
+    fresh = MazeBoard.copy_from(board)
+    tracemalloc.start()
+    try:
+        fresh.adjacency()
+        fresh.junction_graph()
+        index_memory = tracemalloc.get_traced_memory()[0]
+
+        tracemalloc.reset_peak()
+        SolverFromType(solver, fresh, start, goal).solve()
+        return tracemalloc.get_traced_memory()[1] - index_memory, index_memory
+    finally:
+        tracemalloc.stop()
+
+
+def _solve(task: tuple) -> SolverRun:
+    """Runs a solver on the cached maze of an experiment"""
+    (
+        directory,
+        type,
+        height,
+        width,
+        experiment,
+        seed,
+        min_distance,
+        solver,
+        measure_memory,
+    ) = task
+    cache = MazeCache(directory)
+    # Loaded from the cache, or generated again if it got evicted since
+    board = cache.get(type, height, width, seed, min_distance)
+    start, goal = board.cords_as_cell(board.start), board.cords_as_cell(board.end)
+    result = SolverFromType(solver, board, start, goal).solve()
+
+    # Tracing slows the solver down, so memory is measured on a second run
+    # and the timed one stays untraced
+    peak_memory, index_memory = -1, -1
+    if measure_memory:
+        peak_memory, index_memory = _peak_memory(solver, board, start, goal)
+
+    maze_file = os.path.basename(cache.path(type, height, width, seed, min_distance))
+    return SolverRun(
+        experiment=experiment,
+        maze_id=os.path.splitext(maze_file)[0],
+        seed=seed,
+        generator=type,
+        height=height,
+        width=width,
+        solver=solver,
+        distance=board.distance,
+        length=result.length,
+        expansions=result.expansions,
+        elapsed=result.elapsed,
+        found=result.found,
+        peak_memory=peak_memory,
+        index_memory=index_memory,
+    )
+
+
+def run_experiments(
+    type: GeneratorType,
+    height: int,
+    width: int,
+    count: int,
+    solvers: list[SolverType],
+    seed: int,
+    min_distance: int = 10,
+    processes: int = None,
+    cache: MazeCache = None,
+    measure_memory: bool = True,
+) -> Iterator[list[SolverRun]]:
+    """
+    Runs every solver on the mazes of `count` experiments, as problem3 does,
+    over a pool of worker processes, one per core by default.
+
+    Each maze is generated once into the maze cache, experiment i using
+    derive_seed(seed, i) like MazeCache.get_batch(). As soon as it is there,
+    its (maze, solver) pairs are fanned out to the pool, workers loading
+    the maze from the cache without copying it.
+
+    The runs of an experiment are yielded together as soon as all its solvers
+    are done, so experiments come back out of order. Solvers are placed by
+    search time, as they finish in problem3. With `measure_memory` every
+    solver runs a second time under tracemalloc for its peak memory, the
+    indexes of the maze being measured apart.
+    """
+    cache = cache or MazeCache()
+    key = (cache.directory, type, height, width)
+
+    with ProcessPoolExecutor(processes) as pool:
+        # Experiment of the maze generated by every pending generation
+        mazes = {}
+        for experiment in range(count):
+            task = (*key, derive_seed(seed, experiment), min_distance)
+            mazes[pool.submit(_cache_maze, task)] = experiment
+        pending = set(mazes)
+        runs = {}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                # A maze is ready, its solvers can start
+                if future in mazes:
+                    future.result()
+                    experiment = mazes.pop(future)
+                    runs[experiment] = []
+                    maze_seed = derive_seed(seed, experiment)
+                    for solver in solvers:
+                        task = (
+                            *key,
+                            experiment,
+                            maze_seed,
+                            min_distance,
+                            solver,
+                            measure_memory,
+                        )
+                        pending.add(pool.submit(_solve, task))
+                    continue
+
+                run = future.result()
+                experiment_runs = runs[run.experiment]
+                experiment_runs.append(run)
+                if len(experiment_runs) == len(solvers):
+                    del runs[run.experiment]
+                    experiment_runs.sort(key=lambda run: run.elapsed)
+                    for place, run in enumerate(experiment_runs, 1):
+                        run.place = place
+                    yield experiment_runs
@@ -0,0 +1,147 @@
+import hashlib
+import os
+import tempfile
+from typing import Iterator, Tuple
+
+from .maze import MazeBoard
+from .storage import load_board, save_board
+from .generators import GeneratorType, derive_seed, generate_batch, generate_seeded
+
+
+class MazeCache:
+    """
+    On-disk cache of generated mazes. A maze is fully determined by its
+    generator type, size, seed and start / end distance, so every one of them
+    is stored once in a file named after the hash of that key.
+
+    Files use the binary maze format of the storage module. Loads map them in
+    copy-on-write mode: the cells are paged in straight from the file and
+    edits to the board never reach it. Files are evicted least recently used
+    first once the cache holds more than `max_bytes`, their modification time
+    being refreshed on every hit.
+    """
+
+    SUFFIX = ".maze"
+
+    def __init__(self, directory: str = ".maze_cache", max_bytes: int = 1 << 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path(
+        self,
+        type: GeneratorType,
+        height: int,
+        width: int,
+        seed: int,
+        min_distance: int = None,
+    ) -> str:
+        """Path of the file of a maze, whether it is cached or not"""
+        key = f"{GeneratorType(type).name}:{height}:{width}:{seed}:{min_distance}"
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, digest + self.SUFFIX)
+
+    def load(
+        self,
+        type: GeneratorType,
+        height: int,
+        width: int,
+        seed: int,
+        min_distance: int = None,
+    ) -> MazeBoard:
+        """Returns the cached maze, or None if it is not in the cache"""
+        path = self.path(type, height, width, seed, min_distance)
+        try:
+            board = load_board(path)
+        except (FileNotFoundError, ValueError):
+            # Files from another version or left incomplete are misses too
+            return None
+        os.utime(path)
+        return board
+
+    def store(
+        self,
+        type: GeneratorType,
+        height: int,
+        width: int,
+        seed: int,
+        board: MazeBoard,
+        min_distance: int = None,
+    ):
+        """Writes a maze to the cache, evicting old ones if it grows too big"""
+        # Written aside then renamed, readers never see a partial file
+        path = self.path(type, height, width, seed, min_distance)
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory)
+        os.close(descriptor)
+        save_board(board, temporary)
+        os.replace(temporary, path)
+
+        self.evict()
+
+    def get(
+        self,
+        type: GeneratorType,
+        height: int,
+        width: int,
+        seed: int,
+        min_distance: int = None,
+    ) -> MazeBoard:
+        """Returns the maze of a seed, generating and caching it on a miss"""
+        board = self.load(type, height, width, seed, min_distance)
+        if board is None:
+            board = generate_seeded(type, height, width, seed, min_distance)
+            self.store(type, height, width, seed, board, min_distance)
+        return board
+
+    def get_batch(
+        self,
+        type: GeneratorType,
+        height: int,
+        width: int,
+        count: int,
+        seed: int,
+        min_distance: int = None,
+        processes: int = None,
+    ) -> Iterator[Tuple[int, MazeBoard]]:
+        """
+        Same as generate_batch(), yielding the cached mazes first and then
+        generating the missing ones in parallel and caching them.
+        """
+        missing = []
+        for index in range(count):
+            board = self.load(
+                type, height, width, derive_seed(seed, index), min_distance
+            )
+            if board is None:
+                missing.append(index)
+            else:
+                yield index, board
+
+        if not missing:
+            return
+        for index, board in generate_batch(
+            type, height, width, count, seed, min_distance, processes, missing
+        ):
+            self.store(
+                type, height, width, derive_seed(seed, index), board, min_distance
+            )
+            yield index, board
+
+    def evict(self):
+        """Removes the least recently used mazes until the cache fits in max_bytes"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -0,0 +1,44 @@
+from array import array
+
+
+class DisjointSet:
+    """
+    Union-find over the integers [0, size), backed by flat arrays.
+    find() is iterative with path halving and union() merges by rank, so
+    both run in near constant amortized time with no recursion.
+    """
+
+    def __init__(self, size: int):
+        typecode = "i" if size < 2**31 else "q"
+        self.parent = array(typecode, range(size))
+        # Ranks are bounded by log2(size), a byte is plenty
+        self.rank = bytearray(size)
+        self.components = size
+
+    def find(self, element: int) -> int:
+        """Returns the representative of the set holding `element`"""
+        parent = self.parent
+        while parent[element] != element:
+            # Path halving: point every other node to its grandparent
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, a: int, b: int) -> bool:
+        """Merges the sets of `a` and `b`, returns False if they were already one"""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
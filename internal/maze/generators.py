@@ -1,29 +1,107 @@
 from enum import IntEnum
-from typing import Tuple, List
-from .maze import MazeBoard, CellMark
+from typing import Tuple, List, Iterable, Iterator, TextIO
+from array import array
+from .maze import MazeBoard, CellMark, get_random_start_goal, _CELL_CHARS
+from .wall_mask import WallMaskMaze
+from .disjoint_set import DisjointSet
+import numpy as np
+import multiprocessing
 import random
 import math
 
+# Keeps only the wall bits of a grid mask
+_WALL_BITS = bytes(mask & 0b1111 for mask in range(256))
+# Maps the 0 / 1 flags of a closed / open wall to their CellMark
+_OPENINGS = bytes.maketrans(b"\x00\x01", bytes([CellMark.WALL, CellMark.EMPTY]))
+
+
 class GeneratorType(IntEnum):
     BORUBSKA = 0
     PRIM = 1
+    KRUSKAL = 2
+    ELLER = 3
+    BINARY_TREE = 4
+    SIDEWINDER = 5
 
 class Generator:
-    def __init__(self, height: int, width: int):
+    def __init__(self, height: int, width: int, seed: int = None):
         self.height = math.ceil((height - 1) / 2)
         self.width = math.ceil((width - 1) / 2)
-
-    '''Generate a fully flesh-out maze'''
-    def generate(self) -> MazeBoard :
-        raise NotImplementedError("Subclasses should implement generate()")
+        # Same seed, same maze. Unseeded generators draw one from the system
+        self.rng = random.Random(seed)
+        # Board indices of the wall cells opened by the last generate_tick()
+        self.carved = []
+
+    '''
+    Generate a fully flesh-out maze, carving every tick straight into a board.
+    A board of the right size can be passed to be reused, it is reset first.
+    '''
+    def generate(self, maze_board: MazeBoard = None) -> MazeBoard:
+        maze_board = self.blank_maze(maze_board)
+        cells = maze_board.cells
+        while self.generate_tick():
+            for index in self.carved:
+                cells[index] = CellMark.EMPTY
+        maze_board.invalidate_adjacency()
+        return maze_board
 
     '''Represents one tick of the generation step'''
     def generate_tick(self) -> bool:
         raise NotImplementedError("Subclasses should implement generate_tick()")
 
-    '''Returns a Mazeboard representation of the internal maze generator'''
-    def to_maze() -> MazeBoard:
-        raise NotImplementedError("Subclasses should implement generate_tick()")
+    '''
+    Returns a Mazeboard representation of the internal maze generator.
+    It will always return a maze where width and height are odd.
+    '''
+    def to_maze(self, maze_board: MazeBoard = None) -> MazeBoard:
+        maze_board = self.blank_maze(maze_board)
+        masks = np.frombuffer(self.grid, dtype=np.uint8).reshape(self.height, self.width)
+        view = maze_board.as_array()
+        # Walls SOUTH and EAST of every cell, the last ones are the border
+        view[2::2, 1::2] = np.where(masks & (1 << self.SOUTH), CellMark.WALL, CellMark.EMPTY)
+        view[1::2, 2::2] = np.where(masks & (1 << self.EAST), CellMark.WALL, CellMark.EMPTY)
+        maze_board.invalidate_adjacency()
+        return maze_board
+
+    '''Returns the internal bitmask grid as a maze solvers can search directly'''
+    def to_wall_mask_maze(self) -> WallMaskMaze:
+        return WallMaskMaze(self.height, self.width, self.grid.translate(_WALL_BITS))
+
+    '''
+    Returns the MazeBoard of a maze with no passage carved yet. A board of the
+    right size can be passed to be reset in place instead of allocating one.
+    '''
+    def blank_maze(self, maze_board: MazeBoard = None) -> MazeBoard:
+        height, width = self.height * 2 + 1, self.width * 2 + 1
+        if maze_board is None:
+            maze_board = MazeBoard(height, width, CellMark.WALL)
+        elif (maze_board.height, maze_board.width) != (height, width):
+            raise ValueError(
+                f"Board is {maze_board.height}x{maze_board.width}, expected {height}x{width}"
+            )
+        else:
+            maze_board.as_array()[:] = CellMark.WALL
+            maze_board.start = maze_board.end = None
+        maze_board.as_array()[1::2, 1::2] = CellMark.EMPTY
+        maze_board.invalidate_adjacency()
+        return maze_board
+
+    '''
+    Opens on a board the cells carved by the last tick, and returns them.
+    A blank_maze() updated after every tick always matches to_maze().
+    '''
+    def update_maze(self, maze_board: MazeBoard) -> list[int]:
+        for index in self.carved:
+            row, col = maze_board.cell_as_coordinates(index)
+            maze_board.set_cell(row, col, CellMark.EMPTY)
+        return self.carved
+
+    def _gap_index(self, cell: int, direction: int) -> int:
+        """Board index of the wall between a cell and its neighbor in a direction"""
+        i, j = divmod(cell, self.width)
+        board_width = self.width * 2 + 1
+        index = (i * 2 + 1) * board_width + j * 2 + 1
+        return index + (-board_width, board_width, 1, -1)[direction]
 
 class BorubskaGenerator(Generator):
     NORTH = 0
@@ -32,84 +110,168 @@ class BorubskaGenerator(Generator):
     WEST = 3
     VISITED = 4
 
-    def __init__(self, height: int, width: int):
-        super().__init__(height, width)
-        self.rng = random.Random()
-        self.grid = [[0b1111 for _ in range(self.width)] for _ in range(self.height)]
-        self.components = {}  # To keep track of connected components
-        self.edges = []       # List of edges between components
+    def __init__(self, height: int, width: int, seed: int = None):
+        super().__init__(height, width, seed)
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        # Cell (i, j) is stored at index i * width + j
+        self.grid = bytearray([0b1111]) * (self.height * self.width)
         self.phase_completed = False
-        
-        # Initialize components and edges, each cell is its own component
-        for y in range(self.height):
-            for x in range(self.width):
-                idx = y * self.width + x
-
-                # Insert each node as a component
-                self.components[idx] = idx
-
-                # Build all possible edges with their weights.
-                if y > 0:  # NORTH
-                    self.edges.append((idx, idx - self.width))
-                if y < self.height - 1:  # SOUTH
-                    self.edges.append((idx, idx + self.width))
-                if x > 0:  # WEST
-                    self.edges.append((idx, idx - 1))
-                if x < self.width - 1:  # EAST
-                    self.edges.append((idx, idx + 1))
-        # Shuffle the edges to introduce randomness
-        self.rng.shuffle(self.edges)
 
-        
-    def _find(self, component):
-        """Find the root of the component."""
-        if self.components[component] != component:
-            self.components[component] = self._find(self.components[component])
-        return self.components[component]
-
-    def _union(self, u, v):
-        """Union two components."""
-        root_u = self._find(u)
-        root_v = self._find(v)
-        if root_u != root_v:
-            self.components[root_v] = root_u
-
-    def generate(self) -> MazeBoard:
-        """Generate the full maze using Borůvka's algorithm."""
-        while not self.phase_completed:
-            self.generate_tick()
-        return self.to_maze()
+        # Component of every cell, numbered from 0 to component_count - 1
+        size = self.height * self.width
+        self.labels = np.arange(size, dtype=np.int64)
+        self.component_count = size
+
+        # Every edge between neighboring cells with a distinct random weight
+        cells = self.labels.reshape(self.height, self.width)
+        self.edge_u = np.concatenate([cells[:, :-1].ravel(), cells[:-1].ravel()])
+        self.edge_v = np.concatenate([cells[:, 1:].ravel(), cells[1:].ravel()])
+        # Whether v is the SOUTH neighbor of u rather than the EAST one
+        self.edge_south = np.repeat([False, True], [cells[:, :-1].size, cells[:-1].size])
+        self.edge_weight = self.np_rng.permutation(self.edge_u.size)
+
+        if size <= 1:
+            self.phase_completed = True
 
     def generate_tick(self) -> bool:
-        """One step in the Borůvka's algorithm, processing a single edge."""
-        if not self.edges or self.phase_completed:
+        """
+        One round of Borůvka's algorithm: every component picks its cheapest
+        edge to another component at once, and all of them are carved and
+        merged. Weights are distinct so the picked edges never form a cycle,
+        and each round at least halves the number of components.
+        """
+        self.carved = []
+        if self.phase_completed:
             return False
 
-        # Pop one edge from the list
-        u, v = self.edges.pop()
+        # Drop the edges that no longer join two components
+        component_u = self.labels[self.edge_u]
+        component_v = self.labels[self.edge_v]
+        crossing = component_u != component_v
+        self.edge_u = self.edge_u[crossing]
+        self.edge_v = self.edge_v[crossing]
+        self.edge_south = self.edge_south[crossing]
+        self.edge_weight = self.edge_weight[crossing]
+        component_u = component_u[crossing]
+        component_v = component_v[crossing]
+
+        if self.edge_u.size == 0:
+            self.phase_completed = True
+            return False
 
-        root_u = self._find(u)
-        root_v = self._find(v)
+        # Cheapest edge leaving every component
+        cheapest = np.full(self.component_count, np.iinfo(np.int64).max)
+        np.minimum.at(cheapest, component_u, self.edge_weight)
+        np.minimum.at(cheapest, component_v, self.edge_weight)
+        picked_by_u = self.edge_weight == cheapest[component_u]
+        picked_by_v = self.edge_weight == cheapest[component_v]
+        picked = picked_by_u | picked_by_v
+
+        self.carved = self._carve(
+            self.edge_u[picked], self.edge_v[picked], self.edge_south[picked]
+        )
+
+        # Every component points to the one its edge reaches. Two components
+        # picking the same edge point to each other, the smaller becomes root.
+        target = np.arange(self.component_count)
+        target[component_u[picked_by_u]] = component_v[picked_by_u]
+        target[component_v[picked_by_v]] = component_u[picked_by_v]
+        components = np.arange(self.component_count)
+        mutual = (target[target] == components) & (components < target)
+        target[mutual] = components[mutual]
+
+        # Pointer jumping until every component points to its root
+        while True:
+            jumped = target[target]
+            if np.array_equal(jumped, target):
+                break
+            target = jumped
+
+        roots, renumbered = np.unique(target, return_inverse=True)
+        self.labels = renumbered[self.labels]
+        self.component_count = roots.size
+
+        if self.component_count == 1:
+            self.phase_completed = True
 
-        if root_u != root_v:
-            self._union(u, v)
+        return True
 
-            # Remove the walls in the maze representation
-            uy, ux = divmod(u, self.width)
-            vy, vx = divmod(v, self.width)
+    def _carve(self, cells_u: np.ndarray, cells_v: np.ndarray, south: np.ndarray) -> list[int]:
+        """
+        Removes the walls between pairs of cells, where v is SOUTH of u where
+        `south` is set and EAST of it elsewhere.
+        Returns the board indices of the removed walls.
+        """
+        walls = np.frombuffer(self.grid, dtype=np.uint8)
+        east = ~south
+        walls[cells_u[east]] &= ~np.uint8(1 << self.EAST)
+        walls[cells_v[east]] &= ~np.uint8(1 << self.WEST)
+        walls[cells_u[south]] &= ~np.uint8(1 << self.SOUTH)
+        walls[cells_v[south]] &= ~np.uint8(1 << self.NORTH)
+
+        # Board index of the wall: u's center moved one step EAST or SOUTH
+        board_width = self.width * 2 + 1
+        rows, cols = np.divmod(cells_u, self.width)
+        gaps = (rows * 2 + 1) * board_width + cols * 2 + 1
+        gaps += np.where(east, 1, board_width)
+        return gaps.tolist()
+
+
+class KruskalGenerator(Generator):
+    NORTH = 0
+    SOUTH = 1
+    EAST = 2
+    WEST = 3
+    VISITED = 4
 
-            if uy == vy and ux + 1 == vx:
-                self.grid[uy][ux] &= ~(1 << self.EAST)
-                self.grid[vy][vx] &= ~(1 << self.WEST)
-            elif uy == vy and ux - 1 == vx:
-                self.grid[uy][ux] &= ~(1 << self.WEST)
-                self.grid[vy][vx] &= ~(1 << self.EAST)
-            elif ux == vx and uy + 1 == vy:
-                self.grid[uy][ux] &= ~(1 << self.SOUTH)
-                self.grid[vy][vx] &= ~(1 << self.NORTH)
-            elif ux == vx and uy - 1 == vy:
-                self.grid[uy][ux] &= ~(1 << self.NORTH)
-                self.grid[vy][vx] &= ~(1 << self.SOUTH)
+    def __init__(self, height: int, width: int, seed: int = None):
+        super().__init__(height, width, seed)
+        # Cell (i, j) is stored at index i * width + j
+        self.grid = bytearray([0b1111]) * (self.height * self.width)
+        self.components = DisjointSet(self.height * self.width)  # Connected components
+        self.phase_completed = False
+
+        # Every edge between neighboring cells, packed as (cell << 1) | axis
+        # where axis 0 links a cell to its EAST neighbor and 1 to its SOUTH one
+        cells = np.arange(self.height * self.width, dtype=np.int64).reshape(
+            self.height, self.width
+        )
+        east = cells[:, :-1].ravel() << 1
+        south = (cells[:-1].ravel() << 1) | 1
+        self.edges = array("q")
+        self.edges.frombytes(np.concatenate([east, south]).tobytes())
+
+        # Shuffle the edges to introduce randomness, which stands for random weights
+        self.rng.shuffle(self.edges)
+
+    def generate_tick(self) -> bool:
+        """
+        One step in the Kruskal's algorithm, processing edges until one
+        joins two components and carves a passage.
+        """
+        self.carved = []
+        if not self.edges or self.phase_completed:
+            return False
+
+        while self.edges:
+            # Pop one edge from the list
+            edge = self.edges.pop()
+            u = edge >> 1
+
+            if edge & 1:
+                v = u + self.width
+                if self.components.union(u, v):
+                    self.grid[u] &= ~(1 << self.SOUTH)
+                    self.grid[v] &= ~(1 << self.NORTH)
+                    self.carved = [self._gap_index(u, self.SOUTH)]
+                    break
+            else:
+                v = u + 1
+                if self.components.union(u, v):
+                    self.grid[u] &= ~(1 << self.EAST)
+                    self.grid[v] &= ~(1 << self.WEST)
+                    self.carved = [self._gap_index(u, self.EAST)]
+                    break
 
         # If there are no more edges to process, mark as completed
         if not self.edges:
@@ -117,28 +279,6 @@ class BorubskaGenerator(Generator):
 
         return True
 
-    def to_maze(self) -> MazeBoard:
-        """
-            Convert the internal bitmask representation to a MazeBoard.
-            It will always return a maze where width and height are even.
-        """
-        maze_board = MazeBoard(self.height * 2 + 1, self.width * 2 + 1, CellMark.WALL)
-        for i in range(self.height):
-            for j in range(self.width):
-                r, c = i * 2 + 1, j * 2 + 1
-                maze_board.set_cell(r, c, CellMark.EMPTY)
-
-                if not (self.grid[i][j] & (1 << self.NORTH)):
-                    maze_board.set_cell(r - 1, c, CellMark.EMPTY)
-                if not (self.grid[i][j] & (1 << self.SOUTH)):
-                    maze_board.set_cell(r + 1, c, CellMark.EMPTY)
-                if not (self.grid[i][j] & (1 << self.WEST)):
-                    maze_board.set_cell(r, c - 1, CellMark.EMPTY)
-                if not (self.grid[i][j] & (1 << self.EAST)):
-                    maze_board.set_cell(r, c + 1, CellMark.EMPTY)
-
-        return maze_board
-
 class PrimsGenerator(Generator):
     NORTH = 0
     SOUTH = 1
@@ -146,94 +286,377 @@ class PrimsGenerator(Generator):
     WEST = 3
     VISITED = 4
 
-    def __init__(self, height: int, width: int):
-        super().__init__(height, width)
-        self.rng = random.Random()
-        # Initialize all cells with all walls (0b1111) and not visited (0b00000)
-        self.grid = [[0b1111 for _ in range(width)] for _ in range(height)]
-        self.frontier = []
-        
-        
+    # Wall removed on the neighbor when carving towards each direction
+    OPPOSITE = (SOUTH, NORTH, WEST, EAST)
+
+    def __init__(self, height: int, width: int, seed: int = None):
+        super().__init__(height, width, seed)
+        # Initialize all cells with all walls (0b1111) and not visited (0b00000),
+        # cell (i, j) is stored at index i * width + j
+        self.grid = bytearray([0b1111]) * (self.height * self.width)
+        # Flat index offset of the neighbor in each direction
+        self.steps = (-self.width, self.width, 1, -1)
+        # Frontier edges packed as (cell index << 2) | direction
+        self.frontier = array("q")
+
         # Start at a random cell
         start = (self.rng.randint(0, self.height - 1), self.rng.randint(0, self.width - 1))
-        self._mark_visited(*start)
-        self._add_frontier(*start)
+        start = start[0] * self.width + start[1]
+        self._mark_visited(start)
+        self._add_frontier(start)
 
 
-    def _mark_visited(self, i, j):
-        self.grid[i][j] |= (1 << self.VISITED)
+    def _mark_visited(self, cell):
+        self.grid[cell] |= (1 << self.VISITED)
 
-    def _is_visited(self, i, j):
-        return bool(self.grid[i][j] & (1 << self.VISITED))
+    def _is_visited(self, cell):
+        return bool(self.grid[cell] & (1 << self.VISITED))
 
-    def _remove_wall(self, i1, j1, i2, j2, direction):
+    def _remove_wall(self, cell, neighbor, direction):
         # Remove wall between cells based on direction
-        if direction == 'N':
-            self.grid[i1][j1] &= ~(1 << self.NORTH)
-            self.grid[i2][j2] &= ~(1 << self.SOUTH)
-        elif direction == 'S':
-            self.grid[i1][j1] &= ~(1 << self.SOUTH)
-            self.grid[i2][j2] &= ~(1 << self.NORTH)
-        elif direction == 'E':
-            self.grid[i1][j1] &= ~(1 << self.EAST)
-            self.grid[i2][j2] &= ~(1 << self.WEST)
-        elif direction == 'W':
-            self.grid[i1][j1] &= ~(1 << self.WEST)
-            self.grid[i2][j2] &= ~(1 << self.EAST)
-
-    def _add_frontier(self, i, j):
-        for (di, dj, direction, opposite) in [
-            (-1, 0, 'N', 'S'), (1, 0, 'S', 'N'), (0, -1, 'W', 'E'), (0, 1, 'E', 'W')
-        ]:
-            ni, nj = i + di, j + dj
-            if 0 <= ni < self.height and 0 <= nj < self.width and not self._is_visited(ni, nj):
-                self.frontier.append((i, j, ni, nj, direction, opposite))
-
-    def generate(self) -> MazeBoard:
-
-        # Run the generator step by step
-        while self.frontier:
-            self.generate_tick()
-
-        return self.to_maze()
+        self.grid[cell] &= ~(1 << direction)
+        self.grid[neighbor] &= ~(1 << self.OPPOSITE[direction])
+
+    def _add_frontier(self, cell):
+        i, j = divmod(cell, self.width)
+        grid = self.grid
+        visited = 1 << self.VISITED
+        if i > 0 and not grid[cell - self.width] & visited:
+            self.frontier.append((cell << 2) | self.NORTH)
+        if i < self.height - 1 and not grid[cell + self.width] & visited:
+            self.frontier.append((cell << 2) | self.SOUTH)
+        if j > 0 and not grid[cell - 1] & visited:
+            self.frontier.append((cell << 2) | self.WEST)
+        if j < self.width - 1 and not grid[cell + 1] & visited:
+            self.frontier.append((cell << 2) | self.EAST)
+
+    def generate_tick(self) -> bool:
+        """
+            Carves one passage. Frontier edges are drawn uniformly at random and
+            removed by swapping them with the last one. Edges leading to cells
+            visited since they were added are dropped as they come up, which
+            leaves the drawn passages distributed as in randomized Prim.
+        """
+        self.carved = []
+        frontier = self.frontier
+        grid = self.grid
+        visited = 1 << self.VISITED
+        uniform = self.rng.random
+        while frontier:
+            # Pick a random frontier edge
+            pick = int(uniform() * len(frontier))
+            entry = frontier[pick]
+            frontier[pick] = frontier[-1]
+            frontier.pop()
+
+            cell, direction = entry >> 2, entry & 0b11
+            neighbor = cell + self.steps[direction]
+
+            # If the neighboring cell hasn't been visited
+            if not grid[neighbor] & visited:
+                # Remove walls between current cell and chosen neighboring cell
+                grid[cell] &= ~(1 << direction)
+                grid[neighbor] &= ~(1 << self.OPPOSITE[direction])
+                grid[neighbor] |= visited
+                self.carved = [self._gap_index(cell, direction)]
+                # Add new frontiers from the newly visited cell
+                self._add_frontier(neighbor)
+                return True
+
+        return False
+
+class EllerGenerator(Generator):
+    """
+    Eller's algorithm, which builds the maze one row of cells at a time and
+    only remembers which set every cell of the current row belongs to.
+
+    rows() streams the MazeBoard rows with O(width) memory, so mazes of any
+    height can be written out without holding the board. generate_tick()
+    and to_maze() work as in the other generators, by keeping the full grid.
+    A generator instance builds a single maze, either way.
+    """
+    NORTH = 0
+    SOUTH = 1
+    EAST = 2
+    WEST = 3
+    VISITED = 4
+
+    def __init__(self, height: int, width: int, seed: int = None):
+        super().__init__(height, width, seed)
+        self.row = 0  # Next row of cells to build
+        # Set label of every cell in the current row, -1 for a cell not
+        # joined from above yet. Labels always stay within [0, width).
+        self.labels = array("i", [-1]) * self.width
+        self._grid = None
+
+    @property
+    def grid(self) -> bytearray:
+        # Only allocated when the maze is built tick by tick
+        if self._grid is None:
+            self._grid = bytearray([0b1111]) * (self.height * self.width)
+        return self._grid
+
+    def _next_row(self) -> Tuple[bytearray, bytearray]:
+        """
+        Builds the next row of cells. Returns for every cell of the row whether
+        its EAST and its SOUTH walls are open.
+        """
+        width = self.width
+        labels = self.labels
+        uniform = self.rng.random
+        last_row = self.row == self.height - 1
+
+        # Cells not joined from above start a set of their own
+        used = bytearray(width)
+        for label in labels:
+            if label >= 0:
+                used[label] = 1
+        free = (label for label in range(width) if not used[label])
+        for j in range(width):
+            if labels[j] < 0:
+                labels[j] = next(free)
+
+        # Randomly join neighbors of distinct sets, all of them in the last row
+        sets = DisjointSet(width)
+        east = bytearray(width)
+        for j in range(width - 1):
+            if (last_row or uniform() < 0.5) and sets.union(labels[j], labels[j + 1]):
+                east[j] = 1
+
+        south = bytearray(width)
+        if not last_row:
+            # Every set goes down through at least one cell, its last one at worst
+            roots = [sets.find(label) for label in labels]
+            last = {root: j for j, root in enumerate(roots)}
+            went_down = bytearray(width)
+            for j, root in enumerate(roots):
+                if uniform() < 0.5 or (last[root] == j and not went_down[root]):
+                    south[j] = 1
+                    went_down[root] = 1
+
+            for j in range(width):
+                labels[j] = roots[j] if south[j] else -1
+
+        self.row += 1
+        return east, south
+
+    def rows(self) -> Iterator[bytes]:
+        """Yields the rows of the MazeBoard of the maze, from top to bottom"""
+        board_width = self.width * 2 + 1
+        yield bytes([CellMark.WALL]) * board_width
+
+        passage = bytearray([CellMark.WALL]) * board_width
+        passage[1::2] = bytes([CellMark.EMPTY]) * self.width
+        below = bytearray([CellMark.WALL]) * board_width
+        while self.row < self.height:
+            east, south = self._next_row()
+            passage[2::2] = east.translate(_OPENINGS)
+            below[1::2] = south.translate(_OPENINGS)
+            yield bytes(passage)
+            yield bytes(below)
+
+    def write(self, file: TextIO):
+        """Writes the maze to a text file as printed by MazeBoard, row by row"""
+        for row in self.rows():
+            file.write(row.translate(_CELL_CHARS).decode())
+            file.write("\n")
 
     def generate_tick(self) -> bool:
-        if not self.frontier:
+        """Builds one row of cells"""
+        self.carved = []
+        if self.row >= self.height:
             return False
 
-        # Pick a random frontier cell
-        i, j, ni, nj, direction, opposite = self.frontier.pop(self.rng.randint(0, len(self.frontier) - 1))
+        i = self.row
+        grid = self.grid
+        east, south = self._next_row()
+        for j in range(self.width):
+            cell = i * self.width + j
+            if east[j]:
+                grid[cell] &= ~(1 << self.EAST)
+                grid[cell + 1] &= ~(1 << self.WEST)
+                self.carved.append(self._gap_index(cell, self.EAST))
+            if south[j]:
+                grid[cell] &= ~(1 << self.SOUTH)
+                grid[cell + self.width] &= ~(1 << self.NORTH)
+                self.carved.append(self._gap_index(cell, self.SOUTH))
 
-        # If the neighboring cell hasn't been visited
-        if not self._is_visited(ni, nj):
-            # Remove walls between current cell and chosen neighboring cell
-            self._remove_wall(i, j, ni, nj, direction)
-            self._mark_visited(ni, nj)
-            # Add new frontiers from the newly visited cell
-            self._add_frontier(ni, nj)
         return True
 
-    def to_maze(self):
-        maze_board = MazeBoard(self.height * 2 + 1, self.width * 2 + 1, CellMark.WALL)
+class _ArrayGenerator(Generator):
+    """
+    Base of the generators whose carving decisions are all independent random
+    draws. _draw_passages() decides every passage at once with NumPy, then
+    generate() carves them in a few array operations and generate_tick()
+    carves one row of cells per tick.
+    """
+    NORTH = 0
+    SOUTH = 1
+    EAST = 2
+    WEST = 3
+    VISITED = 4
 
-        for i in range(self.height):
-            for j in range(self.width):
-                r, c = i * 2 + 1, j * 2 + 1
-                maze_board.set_cell(r, c, CellMark.EMPTY)
+    def __init__(self, height: int, width: int, seed: int = None):
+        super().__init__(height, width, seed)
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        # Cell (i, j) is stored at index i * width + j
+        self.grid = bytearray([0b1111]) * (self.height * self.width)
+        self.row = 0  # Next row of cells to carve
+        self.east = None
+        self.south = None
 
-                if not (self.grid[i][j] & (1 << self.NORTH)):
-                    maze_board.set_cell(r - 1, c, CellMark.EMPTY)
-                if not (self.grid[i][j] & (1 << self.SOUTH)):
-                    maze_board.set_cell(r + 1, c, CellMark.EMPTY)
-                if not (self.grid[i][j] & (1 << self.WEST)):
-                    maze_board.set_cell(r, c - 1, CellMark.EMPTY)
-                if not (self.grid[i][j] & (1 << self.EAST)):
-                    maze_board.set_cell(r, c + 1, CellMark.EMPTY)
+    def _draw_passages(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns two (height, width) boolean arrays telling whether the EAST
+        and the SOUTH walls of every cell are open.
+        """
+        raise NotImplementedError("Subclasses should implement _draw_passages()")
+
+    def _carve_rows(self, start: int, stop: int):
+        """Removes the walls opened by the rows of cells in [start, stop)"""
+        masks = np.frombuffer(self.grid, dtype=np.uint8).reshape(self.height, self.width)
+        east = self.east[start:stop].view(np.uint8)
+        south = self.south[start:stop].view(np.uint8)
+        masks[start:stop] &= ~((east << self.EAST) | (south << self.SOUTH))
+        masks[start:stop, 1:] &= ~(east[:, :-1] << self.WEST)
+        below = masks[start + 1 : stop + 1]
+        below &= ~(south[: below.shape[0]] << self.NORTH)
+
+    def generate(self, maze_board: MazeBoard = None) -> MazeBoard:
+        """Carves the whole maze at once"""
+        if self.east is None:
+            self.east, self.south = self._draw_passages()
+        self._carve_rows(self.row, self.height)
+        self.row = self.height
+        self.carved = []
+        return self.to_maze(maze_board)
 
-        return maze_board
+    def generate_tick(self) -> bool:
+        """Carves one row of cells"""
+        self.carved = []
+        if self.row >= self.height:
+            return False
+        if self.east is None:
+            self.east, self.south = self._draw_passages()
+
+        i = self.row
+        self._carve_rows(i, i + 1)
+        for j in np.flatnonzero(self.east[i]).tolist():
+            self.carved.append(self._gap_index(i * self.width + j, self.EAST))
+        for j in np.flatnonzero(self.south[i]).tolist():
+            self.carved.append(self._gap_index(i * self.width + j, self.SOUTH))
+
+        self.row += 1
+        return True
 
-def get_generator(type: GeneratorType, height, width) -> Generator:
+class BinaryTreeGenerator(_ArrayGenerator):
+    """
+    Every cell opens its EAST or its SOUTH wall at random. Cells on the last
+    row can only go EAST and cells on the last column only SOUTH.
+    """
+
+    def _draw_passages(self) -> Tuple[np.ndarray, np.ndarray]:
+        east = self.np_rng.random((self.height, self.width)) < 0.5
+        east[-1, :] = True
+        east[:, -1] = False
+        south = ~east
+        south[-1, :] = False
+        return east, south
+
+class SidewinderGenerator(_ArrayGenerator):
+    """
+    The first row is a single corridor. Every other row is split at random
+    into runs of cells joined EAST, and each run opens the wall to the row
+    above from one of its cells, drawn at random.
+    """
+
+    def _draw_passages(self) -> Tuple[np.ndarray, np.ndarray]:
+        height, width = self.height, self.width
+        east = self.np_rng.random((height, width)) < 0.5
+        east[0, :] = True
+        east[:, -1] = False
+        south = np.zeros((height, width), dtype=bool)
+
+        # Runs of the rows below the first, they always end on the last column
+        ends = np.flatnonzero(~east[1:])
+        starts = np.empty_like(ends)
+        starts[0:1] = 0
+        starts[1:] = ends[:-1] + 1
+        lengths = ends - starts + 1
+        picks = starts + (self.np_rng.random(ends.size) * lengths).astype(np.int64)
+
+        # The picked cell of a run goes up, that is the cell above goes SOUTH
+        south.ravel()[picks] = True
+        return east, south
+
+def get_generator(type: GeneratorType, height, width, seed: int = None) -> Generator:
     if type == GeneratorType.BORUBSKA:
-        return BorubskaGenerator(height, width)
+        return BorubskaGenerator(height, width, seed)
     elif type == GeneratorType.PRIM:
-        return PrimsGenerator(height, width)
\ No newline at end of file
+        return PrimsGenerator(height, width, seed)
+    elif type == GeneratorType.KRUSKAL:
+        return KruskalGenerator(height, width, seed)
+    elif type == GeneratorType.ELLER:
+        return EllerGenerator(height, width, seed)
+    elif type == GeneratorType.BINARY_TREE:
+        return BinaryTreeGenerator(height, width, seed)
+    elif type == GeneratorType.SIDEWINDER:
+        return SidewinderGenerator(height, width, seed)
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """
+    Seed of the maze at `index` in a batch generated from `seed`. Passing it to
+    get_generator() regenerates that one maze without the rest of the batch.
+    """
+    return int(np.random.SeedSequence(seed, spawn_key=(index,)).generate_state(1, np.uint64)[0])
+
+
+def generate_seeded(
+    type: GeneratorType, height: int, width: int, seed: int, min_distance: int = None
+) -> MazeBoard:
+    """
+    Generates the maze of a seed. With a `min_distance`, its start and end are
+    also picked as get_random_start_goal() does, from the same seed.
+    """
+    maze_board = get_generator(type, height, width, seed).generate()
+    if min_distance is not None:
+        get_random_start_goal(maze_board, min_distance, random.Random(seed))
+    return maze_board
+
+
+def _generate_seeded(task: Tuple[GeneratorType, int, int, int, int, int]) -> Tuple[int, MazeBoard]:
+    type, height, width, index, seed, min_distance = task
+    return index, generate_seeded(type, height, width, seed, min_distance)
+
+
+def generate_batch(
+    type: GeneratorType,
+    height: int,
+    width: int,
+    count: int,
+    seed: int = None,
+    min_distance: int = None,
+    processes: int = None,
+    indices: Iterable[int] = None,
+) -> Iterator[Tuple[int, MazeBoard]]:
+    """
+    Generates `count` mazes over a pool of worker processes, one per core by
+    default. Yields (index, maze) pairs as soon as each maze is done, so they
+    come back out of order. Maze `index` is built from derive_seed(seed, index).
+
+    With a `min_distance`, the start and end of every maze are also picked in
+    the worker, see generate_seeded(). Given `indices`, only the mazes at
+    those indices of the batch are generated.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if indices is None:
+        indices = range(count)
+
+    tasks = (
+        (type, height, width, index, derive_seed(seed, index), min_distance)
+        for index in indices
+    )
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap_unordered(_generate_seeded, tasks)
\ No newline at end of file
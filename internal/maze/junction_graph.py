@@ -0,0 +1,145 @@
+from array import array
+import numpy as np
+
+# Marks a cell that isn't a node or isn't part of a corridor
+NO_NODE = -1
+NO_EDGE = -1
+
+
+def _index_array(values) -> array:
+    """Copies a NumPy integer array into a compact array('i'/'q')"""
+    values = np.asarray(values)
+    typecode = "i" if values.size == 0 or values.max() < 2**31 else "q"
+    compact = array(typecode)
+    compact.frombytes(values.astype("i" if typecode == "i" else "q").tobytes())
+    return compact
+
+
+class JunctionGraph:
+    """
+    A maze contracted into a weighted graph. Nodes are the junctions and dead
+    ends of the maze (every passable cell without exactly two neighbors), edges
+    are the corridors between them, weighted by their length.
+
+    The interior cells of edge `e`, ordered from `edge_u[e]` to `edge_v[e]`, are
+    `edge_cells[edge_cell_offsets[e]:edge_cell_offsets[e + 1]]`. Each corridor
+    cell also records its edge and its distance from `edge_u` so searches can
+    start or end in the middle of a corridor.
+
+    Corridors closed onto themselves with no junction are anchored on one of
+    their cells, which becomes a node with a looping edge.
+    """
+
+    def __init__(self, adjacency):
+        self.adjacency = adjacency
+        offsets = adjacency.offsets
+        neighbors = adjacency.neighbors
+
+        degree = np.diff(np.asarray(offsets))
+        size = degree.size
+        typecode = "i" if size < 2**31 else "q"
+
+        self.node_cells = _index_array(np.flatnonzero((degree > 0) & (degree != 2)))
+        self.cell_node = array(typecode, [NO_NODE]) * size
+        self.cell_edge = array(typecode, [NO_EDGE]) * size
+        self.cell_position = array(typecode, [0]) * size
+
+        self.edge_u = array(typecode)
+        self.edge_v = array(typecode)
+        self.edge_weight = array(typecode)
+        self.edge_cells = array(typecode)
+        self.edge_cell_offsets = array(typecode, [0])
+
+        for node, cell in enumerate(self.node_cells):
+            self.cell_node[cell] = node
+
+        node = 0
+        while node < len(self.node_cells):
+            self._trace_edges(node)
+            node += 1
+
+        # Any corridor cell left is part of a ring without junctions
+        if len(self.edge_cells) < np.count_nonzero(degree == 2):
+            for cell in np.flatnonzero(degree == 2).tolist():
+                if self.cell_edge[cell] == NO_EDGE and self.cell_node[cell] == NO_NODE:
+                    self.cell_node[cell] = len(self.node_cells)
+                    self.node_cells.append(cell)
+                    self._trace_edges(len(self.node_cells) - 1)
+
+        # CSR table of the edges touching every node, loops appear twice
+        node_count = len(self.node_cells)
+        edge_count = len(self.edge_u)
+        endpoints = np.concatenate(
+            [np.asarray(self.edge_u), np.asarray(self.edge_v)]
+        ).astype(np.int64)
+        order = np.argsort(endpoints, kind="stable")
+        node_offsets = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(endpoints, minlength=node_count), out=node_offsets[1:])
+        self.node_offsets = _index_array(node_offsets)
+        self.node_edges = _index_array(np.tile(np.arange(edge_count), 2)[order])
+
+    def _trace_edges(self, node: int):
+        """Walks every corridor leaving a node that hasn't been traced yet."""
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+        cell_node = self.cell_node
+        cell_edge = self.cell_edge
+        cell_position = self.cell_position
+        edge_cells = self.edge_cells
+
+        source = self.node_cells[node]
+        for k in range(offsets[source], offsets[source + 1]):
+            previous, current = source, neighbors[k]
+
+            if cell_node[current] != NO_NODE:
+                # Adjacent nodes, the edge is recorded from the smaller one
+                if cell_node[current] > node:
+                    self._add_edge(node, cell_node[current], 1)
+                continue
+
+            if cell_edge[current] != NO_EDGE:
+                continue  # Already traced from its other end
+
+            edge = len(self.edge_u)
+            position = 0
+            while cell_node[current] == NO_NODE:
+                position += 1
+                cell_edge[current] = edge
+                cell_position[current] = position
+                edge_cells.append(current)
+
+                first = offsets[current]
+                following = neighbors[first]
+                if following == previous:
+                    following = neighbors[first + 1]
+                previous, current = current, following
+
+            self._add_edge(node, cell_node[current], position + 1)
+
+    def _add_edge(self, u: int, v: int, weight: int):
+        self.edge_u.append(u)
+        self.edge_v.append(v)
+        self.edge_weight.append(weight)
+        self.edge_cell_offsets.append(len(self.edge_cells))
+
+    def node_count(self) -> int:
+        return len(self.node_cells)
+
+    def edge_count(self) -> int:
+        return len(self.edge_u)
+
+    def edge_cell(self, edge: int, position: int) -> int:
+        """Cell at a distance from the `edge_u` end of an edge"""
+        if position == 0:
+            return self.node_cells[self.edge_u[edge]]
+        if position == self.edge_weight[edge]:
+            return self.node_cells[self.edge_v[edge]]
+        return self.edge_cells[self.edge_cell_offsets[edge] + position - 1]
+
+    def edge_segment(self, edge: int, source: int, target: int) -> list[int]:
+        """Cells walked going from one position of an edge to another, excluding the first"""
+        step = 1 if target > source else -1
+        return [
+            self.edge_cell(edge, position)
+            for position in range(source + step, target + step, step)
+        ]
@@ -1,7 +1,10 @@
 from enum import IntEnum
-from typing import Tuple
+from typing import Tuple, List
+import numpy as np
 import random
 
+from .junction_graph import JunctionGraph
+
 
 class CellMark(IntEnum):
     EMPTY = 0
@@ -14,27 +17,148 @@ class CellMark(IntEnum):
     END = 5
 
 
+class AdjacencyIndex:
+    """
+    Immutable CSR neighbor table over the flat cell indices of a maze.
+
+    The passable neighbors of cell `i` are
+    `neighbors[offsets[i]:offsets[i + 1]]`, listed NORTH, EAST, SOUTH, WEST.
+    `directions[i]` holds a bitmask of the open sides of cell `i`.
+    """
+
+    NORTH = 0
+    SOUTH = 1
+    EAST = 2
+    WEST = 3
+
+    def __init__(self, offsets, neighbors, directions):
+        self.offsets = memoryview(offsets).toreadonly()
+        self.neighbors = memoryview(neighbors).toreadonly()
+        self.directions = memoryview(directions).toreadonly()
+
+    def neighbors_of(self, index: int) -> memoryview:
+        return self.neighbors[self.offsets[index] : self.offsets[index + 1]]
+
+    def degree(self, index: int) -> int:
+        return self.offsets[index + 1] - self.offsets[index]
+
+    @staticmethod
+    def from_board(board) -> "AdjacencyIndex":
+        """Compiles the neighbor table of every non WALL cell of a board"""
+        passable = board.as_array() != CellMark.WALL
+        north = np.zeros_like(passable)
+        north[1:] = passable[1:] & passable[:-1]
+        south = np.zeros_like(passable)
+        south[:-1] = passable[:-1] & passable[1:]
+        east = np.zeros_like(passable)
+        east[:, :-1] = passable[:, :-1] & passable[:, 1:]
+        west = np.zeros_like(passable)
+        west[:, 1:] = passable[:, 1:] & passable[:, :-1]
+
+        directions = (
+            (north << AdjacencyIndex.NORTH)
+            | (south << AdjacencyIndex.SOUTH)
+            | (east << AdjacencyIndex.EAST)
+            | (west << AdjacencyIndex.WEST)
+        ).astype(np.uint8)
+
+        return AdjacencyIndex.from_directions(directions)
+
+    @staticmethod
+    def from_directions(directions: np.ndarray) -> "AdjacencyIndex":
+        """
+        Compiles the neighbor table from a (height, width) array holding the
+        open sides of every cell. Sides opening out of the grid are ignored.
+        """
+        height, width = directions.shape
+        size = height * width
+        dtype = np.int32 if size < 2**31 else np.int64
+
+        directions = directions.astype(np.uint8) & 0b1111
+        directions[0] &= ~np.uint8(1 << AdjacencyIndex.NORTH)
+        directions[-1] &= ~np.uint8(1 << AdjacencyIndex.SOUTH)
+        directions[:, -1] &= ~np.uint8(1 << AdjacencyIndex.EAST)
+        directions[:, 0] &= ~np.uint8(1 << AdjacencyIndex.WEST)
+        directions = directions.ravel()
+
+        index = np.arange(size, dtype=dtype)
+        candidates = np.stack(
+            [index - width, index + 1, index + width, index - 1], axis=1
+        )
+        mask = np.stack(
+            [
+                (directions >> side) & 1
+                for side in (
+                    AdjacencyIndex.NORTH,
+                    AdjacencyIndex.EAST,
+                    AdjacencyIndex.SOUTH,
+                    AdjacencyIndex.WEST,
+                )
+            ],
+            axis=1,
+        ).astype(bool)
+
+        offsets = np.zeros(size + 1, dtype=dtype)
+        np.cumsum(mask.sum(axis=1), out=offsets[1:])
+        neighbors = np.ascontiguousarray(candidates[mask])
+
+        return AdjacencyIndex(offsets, neighbors, directions)
+
+
 class MazeBoard:
     """
-    Representation of a maze. The maze is stored as a 1D array of CellMark.
-    It provides utility methods to treat it as a 2D matrix.
+    Representation of a maze. The maze is stored as a 1D bytearray holding one
+    CellMark value per cell. It provides utility methods to treat it as a 2D matrix.
+    Boards made with from_buffer() hold a memoryview over some other buffer.
+
+    Cells read back from the board are plain ints, which compare equal to
+    their CellMark counterpart.
     """
 
     def __init__(self, height: int, width: int, fill: CellMark = CellMark.EMPTY):
         self.height = height
         self.width = width
-        self.cells = [fill] * (height * width)
+        self.cells = bytearray([fill]) * (height * width)
+        self._adjacency = None
+        self._junction_graph = None
+        # Indices changed through set_cell, None while nothing tracks them
+        self.dirty = None
 
     def copy_from(other):
         copy = MazeBoard(other.height, other.width)
         copy.set_distance(other.distance)
+        copy.cells[:] = other.cells
         copy.set_start_and_end(other.start, other.end)
 
-        for i in range(len(other.cells)):
-            copy.cells[i] = other.cells[i]
-
         return copy
 
+    @staticmethod
+    def from_buffer(height: int, width: int, buffer) -> "MazeBoard":
+        """
+        Wraps a writable buffer of height * width CellMark bytes as a board,
+        without copying it. Cells are then read and written in place.
+        """
+        cells = memoryview(buffer).cast("B")
+        if cells.nbytes != height * width:
+            raise ValueError(
+                f"Buffer holds {cells.nbytes} cells, expected {height * width}"
+            )
+        board = MazeBoard(0, 0)
+        board.height = height
+        board.width = width
+        board.cells = cells
+        return board
+
+    def __getstate__(self):
+        # Boards are sent between processes, the cached indexes hold
+        # memoryviews which cannot be pickled and are rebuilt on demand
+        state = self.__dict__.copy()
+        state["cells"] = bytearray(self.cells)
+        state["_adjacency"] = None
+        state["_junction_graph"] = None
+        state["dirty"] = None
+        return state
+
     def get_cell(self, row: int, col: int) -> CellMark:
         if not self._valid_coords(row, col):
             raise IndexError("Coordinates out of bounds")
@@ -45,7 +169,89 @@ class MazeBoard:
             raise IndexError(
                 "Coordinates out of bounds", (self.width, self.height), (row, col)
             )
-        self.cells[self._index(row, col)] = value
+        index = self._index(row, col)
+        # Only wall edits change the topology of the maze
+        if (value == CellMark.WALL) != (self.cells[index] == CellMark.WALL):
+            self.invalidate_adjacency()
+        self.cells[index] = value
+        if self.dirty is not None:
+            self.dirty.add(index)
+
+    def track_changes(self):
+        """
+        Starts recording the indices of the cells changed through set_cell,
+        for renderers to only redraw those. Writes done straight to `cells`
+        are not recorded.
+        """
+        if self.dirty is None:
+            self.dirty = set()
+
+    def take_changes(self) -> set[int]:
+        """Returns the cells changed since the last call, and forgets them"""
+        changed = self.dirty or set()
+        if self.dirty is not None:
+            self.dirty = set()
+        return changed
+
+    def adjacency(self) -> AdjacencyIndex:
+        """
+        Returns the neighbor table of the maze, compiling it on first use.
+        The table is cached until a wall is added or removed through set_cell.
+        """
+        if self._adjacency is None:
+            self._adjacency = AdjacencyIndex.from_board(self)
+        return self._adjacency
+
+    def junction_graph(self) -> JunctionGraph:
+        """
+        Returns the maze contracted into junctions and corridors, building it
+        on first use. It is cached along with the neighbor table.
+        """
+        if self._junction_graph is None:
+            self._junction_graph = JunctionGraph(self.adjacency())
+        return self._junction_graph
+
+    def invalidate_adjacency(self):
+        """
+        Drops the cached neighbor table and junction graph after bulk writes
+        to `cells`
+        """
+        self._adjacency = None
+        self._junction_graph = None
+
+    def get_row(self, row: int) -> memoryview:
+        """Returns a zero-copy view over the cells of a single row"""
+        if not 0 <= row < self.height:
+            raise IndexError("Row out of bounds", self.height, row)
+        start = row * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def get_region(
+        self, row: int, col: int, height: int, width: int
+    ) -> List[memoryview]:
+        """Returns zero-copy views over the rows of a rectangular region"""
+        if not (
+            self._valid_coords(row, col)
+            and self._valid_coords(row + height - 1, col + width - 1)
+        ):
+            raise IndexError(
+                "Region out of bounds", (self.width, self.height), (row, col)
+            )
+        view = memoryview(self.cells)
+        return [
+            view[r * self.width + col : r * self.width + col + width]
+            for r in range(row, row + height)
+        ]
+
+    def as_array(self) -> np.ndarray:
+        """
+        Returns a (height, width) NumPy view over the cells.
+        Writes through the view are reflected on the board, wall edits done
+        this way must be followed by invalidate_adjacency().
+        """
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(
+            self.height, self.width
+        )
 
     def cell_as_coordinates(self, index: int) -> Tuple[int, int]:
         """Returns 2D coordinates given a cell index"""
@@ -78,28 +284,124 @@ class MazeBoard:
     def __str__(self):
         result = ""
         for r in range(self.height):
-            for c in range(self.width):
-                cell = self.get_cell(r, c)
-                if cell == CellMark.EMPTY:
-                    result += " "
-                elif cell == CellMark.WALL:
-                    result += "#"
-                elif cell == CellMark.PATH:
-                    result += "o"
-                elif cell == CellMark.SCANNED:
-                    result += "x"
-                elif cell == CellMark.START:
-                    result += "+"
-                elif cell == CellMark.END:
-                    result += "*"
+            result += self.get_row(r).tobytes().translate(_CELL_CHARS).decode()
             result += "\n"
         return result
 
 
-def get_random_start_goal(maze: MazeBoard, min_distance: int):
+class MazeOverlay(MazeBoard):
+    """
+    Marks of a single solver over a MazeBoard shared with others. The walls,
+    start, end and distance, the neighbor table and the junction graph all
+    come from the base board, which must not change while overlays use it.
+
+    Marks live in their own layer holding the mark of a cell plus one, 0 for
+    an unmarked cell. It is only allocated by the first mark, so an overlay
+    costs no memory per cell until its solver starts marking.
+    """
+
+    def __init__(self, base: MazeBoard, marks=None):
+        super().__init__(0, 0)
+        self.base = base
+        self.height = base.height
+        self.width = base.width
+        self.cells = base.cells
+        self.marks = marks
+        self.start = getattr(base, "start", None)
+        self.end = getattr(base, "end", None)
+        if hasattr(base, "distance"):
+            self.set_distance(base.distance)
+
+    def get_cell(self, row: int, col: int) -> CellMark:
+        if not self._valid_coords(row, col):
+            raise IndexError("Coordinates out of bounds")
+        index = self._index(row, col)
+        mark = self.marks[index] if self.marks is not None else 0
+        return mark - 1 if mark else self.cells[index]
+
+    def set_cell(self, row: int, col: int, value: CellMark):
+        """Marks a cell, setting back its value on the base board clears it"""
+        if not self._valid_coords(row, col):
+            raise IndexError(
+                "Coordinates out of bounds", (self.width, self.height), (row, col)
+            )
+        index = self._index(row, col)
+        cell = self.cells[index]
+        if value == CellMark.WALL or cell == CellMark.WALL:
+            if value == cell:
+                return
+            raise ValueError("Walls of a MazeOverlay can't be changed")
+        if self.marks is None:
+            if value == cell:
+                return
+            self.marks = bytearray(self.height * self.width)
+        self.marks[index] = 0 if value == cell else value + 1
+        if self.dirty is not None:
+            self.dirty.add(index)
+
+    def clear_marks(self):
+        """Removes every mark, giving back the base board"""
+        if self.dirty is not None and self.marks is not None:
+            self.dirty.update(
+                np.flatnonzero(np.frombuffer(self.marks, dtype=np.uint8)).tolist()
+            )
+        self.marks = None
+
+    def adjacency(self) -> AdjacencyIndex:
+        return self.base.adjacency()
+
+    def junction_graph(self) -> JunctionGraph:
+        return self.base.junction_graph()
+
+    def get_row(self, row: int) -> memoryview:
+        """
+        Returns the cells of a single row with their marks. It is a zero-copy
+        view of the base board until something is marked, a copy after.
+        """
+        if self.marks is None:
+            return self.base.get_row(row)
+        if not 0 <= row < self.height:
+            raise IndexError("Row out of bounds", self.height, row)
+        start = row * self.width
+        cells = np.frombuffer(self.cells[start : start + self.width], dtype=np.uint8)
+        marks = np.frombuffer(self.marks[start : start + self.width], dtype=np.uint8)
+        return memoryview(np.where(marks != 0, marks - 1, cells).astype(np.uint8))
+
+    def get_region(
+        self, row: int, col: int, height: int, width: int
+    ) -> List[memoryview]:
+        """Returns the rows of a rectangular region with their marks"""
+        if not (
+            self._valid_coords(row, col)
+            and self._valid_coords(row + height - 1, col + width - 1)
+        ):
+            raise IndexError("Region out of bounds", (row, col, height, width))
+        return [self.get_row(r)[col : col + width] for r in range(row, row + height)]
+
+
+# Translation table from CellMark values to their printable character
+_CELL_CHARS = bytes.maketrans(
+    bytes(
+        [
+            CellMark.EMPTY,
+            CellMark.WALL,
+            CellMark.PATH,
+            CellMark.SCANNED,
+            CellMark.START,
+            CellMark.END,
+        ]
+    ),
+    b" #ox+*",
+)
+
+
+def get_random_start_goal(
+    maze: MazeBoard, min_distance: int, rng: random.Random = random
+):
     """
     Select 2 random EMPTY cells from a mazeboard with a list a minimum manhattan distance.
     The start and end of the MazeBoard are set in place!
+    A seeded `rng` picks the same cells every time, the global one is used otherwise.
     """
 
     empty_cells = [
@@ -109,10 +411,10 @@ def get_random_start_goal(maze: MazeBoard, min_distance: int):
     ]
 
     # Pick a random starting cell
-    first_cell = random.choice(empty_cells)
+    first_cell = rng.choice(empty_cells)
 
     # Shuffle and find the first one that matches the distance
-    random.shuffle(empty_cells)
+    rng.shuffle(empty_cells)
     for cell in empty_cells:
         distance = abs(first_cell[0] - cell[0]) + abs(first_cell[1] - cell[1])
         if distance >= min_distance:
@@ -0,0 +1,240 @@
+import mmap
+import os
+import struct
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from .maze import AdjacencyIndex, CellMark, MazeBoard, MazeOverlay
+
+# Binary maze files hold this header followed by the height * width cells of
+# the board, one CellMark byte each, row after row. Missing start, end and
+# distance are stored as -1.
+#   magic, version, height, width, start row / col, end row / col, distance
+HEADER = struct.Struct("<4sBIIiiiiq")
+MAGIC = b"MAZE"
+VERSION = 1
+
+
+def save_rows(
+    path: str,
+    height: int,
+    width: int,
+    rows: Iterable[bytes],
+    start: Tuple[int, int] = None,
+    end: Tuple[int, int] = None,
+    distance: int = None,
+):
+    """
+    Writes a maze file from its rows as they come, such as the ones streamed
+    by EllerGenerator.rows(), so the board never needs to fit in memory.
+    """
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        height,
+        width,
+        *(start or (-1, -1)),
+        *(end or (-1, -1)),
+        -1 if distance is None else distance,
+    )
+    with open(path, "wb") as file:
+        file.write(header)
+        written = 0
+        for row in rows:
+            file.write(row)
+            written += 1
+
+    if written != height:
+        raise ValueError(f"Got {written} rows, expected {height}")
+
+
+def save_board(board: MazeBoard, path: str):
+    """Writes a board, with its start, end and distance, to a maze file"""
+    save_rows(
+        path,
+        board.height,
+        board.width,
+        (board.get_row(row) for row in range(board.height)),
+        getattr(board, "start", None),
+        getattr(board, "end", None),
+        getattr(board, "distance", None),
+    )
+
+
+def _map(path: str, access: int) -> Tuple[mmap.mmap, tuple]:
+    """Maps a maze file and checks its header, returns the map and the header"""
+    with open(path, "rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=access)
+        except ValueError:
+            raise ValueError(f"{path} is empty") from None
+
+    if len(mapped) < HEADER.size:
+        raise ValueError(f"{path} is not a maze file")
+    header = HEADER.unpack_from(mapped)
+    magic, version, height, width = header[:4]
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a maze file")
+    if len(mapped) != HEADER.size + height * width:
+        raise ValueError(f"{path} is truncated")
+    return mapped, header
+
+
+def _apply_header(board: MazeBoard, header: tuple):
+    start_row, start_col, end_row, end_col, distance = header[4:]
+    board.start = (start_row, start_col) if start_row >= 0 else None
+    board.end = (end_row, end_col) if end_row >= 0 else None
+    if distance >= 0:
+        board.set_distance(distance)
+
+
+def load_board(path: str) -> MazeBoard:
+    """
+    Loads a maze file without reading it: the cells are mapped copy-on-write,
+    paged in as they are used, and edits to the board never reach the file.
+    """
+    mapped, header = _map(path, mmap.ACCESS_COPY)
+    board = MazeBoard.from_buffer(
+        header[2], header[3], memoryview(mapped)[HEADER.size :]
+    )
+    _apply_header(board, header)
+    return board
+
+
+class MappedMazeBoard(MazeOverlay):
+    """
+    MazeOverlay over a maze file that may be larger than memory. The file is
+    mapped read-only and paged in lazily as the base board. Marks go to a
+    separate overlay file with one byte per cell, created sparse and cleared
+    on every open, so solvers run unchanged without ever touching the maze.
+
+    The neighbor table is built band by band into files next to the maze and
+    reused while they are newer than it. Solvers still keep their own per-cell
+    state in memory.
+    """
+
+    # Cells compiled per band when building the neighbor table
+    BAND_CELLS = 1 << 22
+
+    def __init__(self, path: str, overlay_path: str = None):
+        self.path = path
+        self.overlay_path = overlay_path or path + ".marks"
+        self._mapped, header = _map(path, mmap.ACCESS_READ)
+        height, width = header[2], header[3]
+        source = MazeBoard.from_buffer(
+            height, width, memoryview(self._mapped)[HEADER.size :]
+        )
+
+        size = height * width
+        with open(self.overlay_path, "w+b") as file:
+            file.truncate(size)
+            self._overlay_map = mmap.mmap(file.fileno(), size) if size else bytearray()
+        super().__init__(source, memoryview(self._overlay_map))
+
+        # The start and end are drawn as marks, as set_start_and_end() does
+        _apply_header(self, header)
+        if self.start is not None and self.end is not None:
+            self.set_start_and_end(self.start, self.end)
+
+    def clear_marks(self):
+        """Removes every mark, giving back the maze as stored"""
+        marks = np.frombuffer(self.marks, dtype=np.uint8)
+        if self.dirty is not None:
+            self.dirty.update(np.flatnonzero(marks).tolist())
+        marks[:] = 0
+
+    def adjacency(self) -> AdjacencyIndex:
+        if self._adjacency is None:
+            self._adjacency = self._mapped_adjacency()
+        return self._adjacency
+
+    # Built from the mapped neighbor table, not from the base board
+    junction_graph = MazeBoard.junction_graph
+
+    def _mapped_adjacency(self) -> AdjacencyIndex:
+        """
+        Loads the neighbor table files of the maze, building them first if
+        they are missing or older than the maze. Same table as
+        AdjacencyIndex.from_board(), but only one band of rows is ever held.
+        """
+        height, width = self.height, self.width
+        size = height * width
+        dtype = np.int32 if size < 2**31 else np.int64
+        base = self.path + ".adjacency"
+        paths = [f"{base}.{name}" for name in ("offsets", "neighbors", "directions")]
+
+        built = os.path.getmtime(self.path)
+        if all(
+            os.path.exists(path) and os.path.getmtime(path) > built for path in paths
+        ):
+            offsets = np.memmap(paths[0], dtype=dtype, mode="r")
+            neighbors = np.memmap(paths[1], dtype=dtype, mode="r")
+            directions = np.memmap(paths[2], dtype=np.uint8, mode="r")
+            return AdjacencyIndex(offsets, neighbors[: offsets[-1]], directions[:size])
+
+        source = self.as_array()
+        band = max(1, self.BAND_CELLS // max(width, 1))
+        offsets = np.memmap(paths[0], dtype=dtype, mode="w+", shape=(size + 1,))
+        # Files are never empty, NumPy can't map those
+        directions = np.memmap(
+            paths[2], dtype=np.uint8, mode="w+", shape=(max(size, 1),)
+        )
+
+        # First pass: open sides and degree of every cell
+        total = 0
+        offsets[0] = 0
+        for top in range(0, height, band):
+            bottom = min(top + band, height)
+            passable = np.zeros((bottom - top + 2, width), dtype=bool)
+            passable[1:-1] = source[top:bottom] != CellMark.WALL
+            if top > 0:
+                passable[0] = source[top - 1] != CellMark.WALL
+            if bottom < height:
+                passable[-1] = source[bottom] != CellMark.WALL
+            cells = passable[1:-1]
+
+            sides = np.zeros((4,) + cells.shape, dtype=bool)
+            sides[AdjacencyIndex.NORTH] = cells & passable[:-2]
+            sides[AdjacencyIndex.SOUTH] = cells & passable[2:]
+            sides[AdjacencyIndex.EAST, :, :-1] = cells[:, :-1] & cells[:, 1:]
+            sides[AdjacencyIndex.WEST, :, 1:] = cells[:, 1:] & cells[:, :-1]
+
+            open_sides = (
+                (sides[AdjacencyIndex.NORTH] << AdjacencyIndex.NORTH)
+                | (sides[AdjacencyIndex.SOUTH] << AdjacencyIndex.SOUTH)
+                | (sides[AdjacencyIndex.EAST] << AdjacencyIndex.EAST)
+                | (sides[AdjacencyIndex.WEST] << AdjacencyIndex.WEST)
+            ).astype(np.uint8)
+            directions[top * width : bottom * width] = open_sides.ravel()
+            degrees = np.cumsum(sides.sum(axis=0).ravel(), dtype=np.int64) + total
+            offsets[top * width + 1 : bottom * width + 1] = degrees
+            if degrees.size:
+                total = int(degrees[-1])
+
+        # Second pass: neighbors listed NORTH, EAST, SOUTH, WEST
+        neighbors = np.memmap(paths[1], dtype=dtype, mode="w+", shape=(max(total, 1),))
+        for top in range(0, height, band):
+            bottom = min(top + band, height)
+            open_sides = directions[top * width : bottom * width]
+            index = np.arange(top * width, bottom * width, dtype=dtype)
+            candidates = np.stack(
+                [index - width, index + 1, index + width, index - 1], axis=1
+            )
+            mask = np.stack(
+                [
+                    (open_sides >> side) & 1
+                    for side in (
+                        AdjacencyIndex.NORTH,
+                        AdjacencyIndex.EAST,
+                        AdjacencyIndex.SOUTH,
+                        AdjacencyIndex.WEST,
+                    )
+                ],
+                axis=1,
+            ).astype(bool)
+            neighbors[offsets[top * width] : offsets[bottom * width]] = candidates[mask]
+
+        for array in (offsets, neighbors, directions):
+            array.flush()
+        return AdjacencyIndex(offsets, neighbors[:total], directions[:size])
@@ -0,0 +1,117 @@
+from typing import Tuple
+import numpy as np
+
+from .maze import MazeBoard, CellMark, AdjacencyIndex
+from .junction_graph import JunctionGraph
+
+
+class WallMaskMaze:
+    """
+    Maze stored the way the generators build it: one byte per cell holding
+    its NORTH, SOUTH, EAST and WEST wall bits. Cell (row, col) stands for the
+    cell (2 * row + 1, 2 * col + 1) of the equivalent MazeBoard, which has
+    about four times as many cells.
+
+    It exposes the parts of the MazeBoard interface solvers rely on, so any
+    solver can search it directly. Marks written by solvers are kept apart
+    in `marks`. Paths found on it are mapped back to board cells with
+    to_board_path().
+    """
+
+    NORTH = AdjacencyIndex.NORTH
+    SOUTH = AdjacencyIndex.SOUTH
+    EAST = AdjacencyIndex.EAST
+    WEST = AdjacencyIndex.WEST
+
+    def __init__(self, height: int, width: int, walls: bytearray):
+        self.height = height
+        self.width = width
+        self.walls = walls
+        self.marks = bytearray(height * width)
+        self._adjacency = None
+        self._junction_graph = None
+
+    def board_height(self) -> int:
+        return self.height * 2 + 1
+
+    def board_width(self) -> int:
+        return self.width * 2 + 1
+
+    def adjacency(self) -> AdjacencyIndex:
+        """Returns the neighbor table read from the wall bits, compiling it on first use"""
+        if self._adjacency is None:
+            walls = np.frombuffer(self.walls, dtype=np.uint8)
+            directions = ~walls.reshape(self.height, self.width)
+            self._adjacency = AdjacencyIndex.from_directions(directions)
+        return self._adjacency
+
+    def junction_graph(self) -> JunctionGraph:
+        if self._junction_graph is None:
+            self._junction_graph = JunctionGraph(self.adjacency())
+        return self._junction_graph
+
+    def get_cell(self, row: int, col: int) -> CellMark:
+        if not self._valid_coords(row, col):
+            raise IndexError("Coordinates out of bounds")
+        return self.marks[row * self.width + col]
+
+    def set_cell(self, row: int, col: int, value: CellMark):
+        """Marks a cell, walls live between cells so they can't be set"""
+        if not self._valid_coords(row, col):
+            raise IndexError(
+                "Coordinates out of bounds", (self.width, self.height), (row, col)
+            )
+        if value == CellMark.WALL:
+            raise ValueError("Cells of a WallMaskMaze can't be walls")
+        self.marks[row * self.width + col] = value
+
+    def cell_as_coordinates(self, index: int) -> Tuple[int, int]:
+        """Returns 2D coordinates given a cell index"""
+        row = index // self.width
+        col = index - row * self.width
+        return (row, col)
+
+    def cords_as_cell(self, cords: tuple[int, int]) -> int:
+        return cords[0] * self.width + cords[1]
+
+    def from_board_cell(self, board_index: int) -> int:
+        """Cell index of a board cell, which must be the center of a cell"""
+        row, col = divmod(board_index, self.board_width())
+        if row % 2 == 0 or col % 2 == 0:
+            raise ValueError("Board cell isn't the center of a maze cell", (row, col))
+        return (row // 2) * self.width + col // 2
+
+    def to_board_cell(self, index: int) -> int:
+        """Board index of the center of a cell"""
+        row, col = divmod(index, self.width)
+        return (row * 2 + 1) * self.board_width() + col * 2 + 1
+
+    def to_board_path(self, path: list[int]) -> list[int]:
+        """Maps a path of cells to board cells, adding the gaps between them"""
+        board_path = []
+        for index in path:
+            board_index = self.to_board_cell(index)
+            if board_path:
+                # The gap sits halfway between two adjacent cell centers
+                board_path.append((board_path[-1] + board_index) // 2)
+            board_path.append(board_index)
+        return board_path
+
+    def to_maze(self) -> MazeBoard:
+        """Expands the maze into a MazeBoard"""
+        board = MazeBoard(self.board_height(), self.board_width(), CellMark.WALL)
+        cells = board.as_array()
+        walls = np.frombuffer(self.walls, dtype=np.uint8).reshape(
+            self.height, self.width
+        )
+
+        cells[1::2, 1::2] = CellMark.EMPTY
+        east_open = (walls[:, :-1] & (1 << self.EAST)) == 0
+        cells[1::2, 2:-1:2][east_open] = CellMark.EMPTY
+        south_open = (walls[:-1] & (1 << self.SOUTH)) == 0
+        cells[2:-1:2, 1::2][south_open] = CellMark.EMPTY
+
+        return board
+
+    def _valid_coords(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
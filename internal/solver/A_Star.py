@@ -1,14 +1,19 @@
 from enum import StrEnum
 from typing import Tuple
 from ..maze.maze import MazeBoard, CellMark
-from .solver import Solver
+from .solver import Solver, cell_array, unreached
 
 import heapq
 
+# Values of the per cell search state
+OPEN = 1
+CLOSED = 2
+
 
 class A_Star(Solver):
     def __init__(self, board: MazeBoard, start: int, goal: int):
         super().__init__(board, start, goal)
+        self.adjacency = board.adjacency()
 
         self.start = start
         self.goal = goal
@@ -17,44 +22,40 @@ class A_Star(Solver):
         self.start_coords = self.board.cell_as_coordinates(start)
         self.goal_coords = self.board.cell_as_coordinates(goal)
 
-        # Priority queue for A* - stores (f_score, count, coords)
+        size = board.height * board.width
+
+        # Priority queue for A* - stores (f_score, count, index)
         # Count is used to break ties for cells with equal f_scores
         self.open_set = []
         self.open_set_counter = 0  # Used to break ties in priority queue
 
-        # Track which nodes are in the open set for faster lookup
-        self.in_open_set = set()
+        # Track whether each cell is in the open set (OPEN) or closed set (CLOSED)
+        self.state = bytearray(size)
 
-        # Track visited (closed set) cells
-        self.visited = set()
-
-        # Track g_score (actual cost from start) and f_score (g_score + heuristic)
-        self.g_score = {}  # Stores actual cost from start
-        self.f_score = {}  # Stores g_score + heuristic
+        # Track g_score (actual cost from start), f_score is only kept in the heap
+        self.g_score = cell_array(size, unreached(size))
 
         # Initialize start node
         self.g_score[self.start] = 0
-        self.f_score[self.start] = self._heuristic(self.start_coords)
 
         # Add start node to open set
         heapq.heappush(
             self.open_set,
-            (self.f_score[self.start], self.open_set_counter, self.start_coords),
+            (self._heuristic(self.start), self.open_set_counter, self.start),
         )
         self.open_set_counter += 1
-        self.in_open_set.add(self.start)
+        self.state[self.start] = OPEN
 
         # For path reconstruction
-        self.came_from = {}
+        self.came_from = cell_array(size)
 
         # Flag to indicate if we've reached the goal
         self.goal_reached = False
 
-    def _heuristic(self, coords):
+    def _heuristic(self, index):
         """Manhattan distance heuristic"""
-        return abs(coords[0] - self.goal_coords[0]) + abs(
-            coords[1] - self.goal_coords[1]
-        )
+        row, col = divmod(index, self.board.width)
+        return abs(row - self.goal_coords[0]) + abs(col - self.goal_coords[1])
 
     def solve_tick(self) -> bool:
         # If we've already reached the goal and reconstructed the path, we're done
@@ -67,105 +68,117 @@ class A_Star(Solver):
             return True  # Done, but no solution
 
         # Get the node with the lowest f_score from the priority queue
-        _, _, current_coords = heapq.heappop(self.open_set)
-        current_index = self.board.cords_as_cell(current_coords)
-
-        # Remove from the open set tracking
-        self.in_open_set.remove(current_index)
+        _, _, current_index = heapq.heappop(self.open_set)
 
         # If we've reached the goal
-        if current_coords == self.goal_coords:
+        if current_index == self.goal:
             self.goal_reached = True
             self._reconstruct_path()
             return True
 
-        # Add to visited set
-        self.visited.add(current_index)
+        # Move from the open set to the closed set
+        self.state[current_index] = CLOSED
         self.scanned_tiles += 1
 
         # Mark current cell as scanned (if it's not the start or end)
-        current_row, current_col = current_coords
-        if self.board.get_cell(current_row, current_col) not in [
-            CellMark.START,
-            CellMark.END,
-        ]:
+        if current_index != self.start:
+            current_row, current_col = self.board.cell_as_coordinates(current_index)
             self.board.set_cell(current_row, current_col, CellMark.SCANNED)
 
         # Explore neighbors
-        neighbors = self._get_valid_neighbors(current_coords)
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
 
-        for neighbor_coords in neighbors:
-            neighbor_index = self.board.cords_as_cell(neighbor_coords)
+        for k in range(offsets[current_index], offsets[current_index + 1]):
+            neighbor_index = neighbors[k]
 
             # Skip if already in closed set
-            if neighbor_index in self.visited:
+            if self.state[neighbor_index] == CLOSED:
                 continue
 
             # Calculate tentative g_score (cost from start to this neighbor through current)
             # In a simple grid like this, all moves cost 1
             tentative_g_score = self.g_score[current_index] + 1
 
-            if (
-                neighbor_index not in self.g_score
-                or tentative_g_score < self.g_score[neighbor_index]
-            ):
+            if tentative_g_score < self.g_score[neighbor_index]:
                 # This path to neighbor is better than any previous one
                 self.came_from[neighbor_index] = current_index
                 self.g_score[neighbor_index] = tentative_g_score
-                self.f_score[neighbor_index] = tentative_g_score + self._heuristic(
-                    neighbor_coords
-                )
 
-                if neighbor_index not in self.in_open_set:
+                if self.state[neighbor_index] != OPEN:
                     # Add to open set
                     heapq.heappush(
                         self.open_set,
                         (
-                            self.f_score[neighbor_index],
+                            tentative_g_score + self._heuristic(neighbor_index),
                             self.open_set_counter,
-                            neighbor_coords,
+                            neighbor_index,
                         ),
                     )
                     self.open_set_counter += 1
-                    self.in_open_set.add(neighbor_index)
+                    self.state[neighbor_index] = OPEN
 
         return False  # Not done yet
 
-    def _get_valid_neighbors(self, position):
-        """Get all valid neighbors of the current position."""
-        row, col = position
-        neighbors = []
-
-        # Define the four possible directions (up, right, down, left)
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-
-            # Check if the new position is valid
-            if not self.board._valid_coords(new_row, new_col):
-                continue
-
-            # Get the cell mark at the new position
-            cell = self.board.get_cell(new_row, new_col)
-
-            # Check if the new position is a valid move
-            if cell in [CellMark.EMPTY, CellMark.END]:
-                neighbors.append((new_row, new_col))
-
-        return neighbors
+    def _run(self, limit: float, mark_board: bool) -> bool:
+        """Runs A* without per tick overhead, used by solve()."""
+        open_set = self.open_set
+        state = self.state
+        g_score = self.g_score
+        came_from = self.came_from
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+        start, goal = self.start, self.goal
+        goal_row, goal_col = self.goal_coords
+        width = self.board.width
+        set_cell = self.board.set_cell
+        heappop, heappush = heapq.heappop, heapq.heappush
+        counter = self.open_set_counter
+        scanned = self.scanned_tiles
+
+        while open_set and not self.goal_reached and scanned < limit:
+            _, _, current = heappop(open_set)
+
+            if current == goal:
+                self.goal_reached = True
+                self.solution_path = self._trace_path(came_from, start, goal)
+                if mark_board:
+                    self._mark_path(self.solution_path)
+                break
+
+            state[current] = CLOSED
+            scanned += 1
+
+            if mark_board and current != start:
+                set_cell(current // width, current % width, CellMark.SCANNED)
+
+            tentative_g_score = g_score[current] + 1
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[k]
+                neighbor_state = state[neighbor]
+                if neighbor_state == CLOSED:
+                    continue
+
+                if tentative_g_score < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+
+                    if neighbor_state != OPEN:
+                        row, col = divmod(neighbor, width)
+                        f = (
+                            tentative_g_score
+                            + abs(row - goal_row)
+                            + abs(col - goal_col)
+                        )
+                        heappush(open_set, (f, counter, neighbor))
+                        counter += 1
+                        state[neighbor] = OPEN
+
+        self.open_set_counter = counter
+        self.scanned_tiles = scanned
+        return self.goal_reached
 
     def _reconstruct_path(self):
         """Reconstruct the path from start to goal."""
-        current = self.board.cords_as_cell(self.goal_coords)
-        start_index = self.start
-
-        while current != start_index:
-            current_coords = self.board.cell_as_coordinates(current)
-            row, col = current_coords
-
-            # Mark the cell as part of the path (except start and end)
-            if self.board.get_cell(row, col) not in [CellMark.START, CellMark.END]:
-                self.board.set_cell(row, col, CellMark.PATH)
-
-            current = self.came_from[current]
+        self.solution_path = self._trace_path(self.came_from, self.start, self.goal)
+        self._mark_path(self.solution_path)
@@ -2,13 +2,14 @@ from enum import StrEnum
 from typing import Tuple, List, Set, Dict, Deque
 from collections import deque
 from ..maze.maze import MazeBoard, CellMark
-from .solver import Solver
+from .solver import Solver, cell_array
 
 
 class BFS(Solver):
     def __init__(self, board: MazeBoard, start: int, goal: int):
         super().__init__(board, start, goal)
         self.board = board
+        self.adjacency = board.adjacency()
 
         self.start_index = start
         self.goal_index = goal
@@ -16,31 +17,20 @@ class BFS(Solver):
         self.start_coords = self.board.cell_as_coordinates(start)
         self.goal_coords = self.board.cell_as_coordinates(goal)
 
-        self.queue = deque([self.start_coords])
-        self.visited = {self.start_coords}
-        self.parent = {self.start_coords: None}
+        size = board.height * board.width
+        self.queue = deque([start])
+        self.visited = bytearray(size)  # 1 once a cell has been queued
+        self.parent = cell_array(size)
+        self.visited[start] = 1
 
         self.scanned_tiles = 0
         self.solution_path = []
         self.found_goal = False
         self.reconstructed_path = False
 
-    def get_neighbors(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get valid neighboring cells (up, down, left, right)."""
-        row, col = position
-        neighbors = []
-
-        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            new_row, new_col = row + dr, col + dc
-
-            if (
-                0 <= new_row < self.board.height
-                and 0 <= new_col < self.board.width
-                and self.board.get_cell(new_row, new_col) != CellMark.WALL
-            ):
-                neighbors.append((new_row, new_col))
-
-        return neighbors
+    def get_neighbors(self, index: int) -> List[int]:
+        """Get valid neighboring cells (up, right, down, left)."""
+        return list(self.adjacency.neighbors_of(index))
 
     def solve_tick(self) -> bool:
         """Perform one step of BFS algorithm."""
@@ -58,45 +48,79 @@ class BFS(Solver):
 
         current = self.queue.popleft()
 
-        if current == self.goal_coords:
+        if current == self.goal_index:
             self.found_goal = True
             return False
 
-        for neighbor in self.get_neighbors(current):
-            if neighbor not in self.visited:
-                self.visited.add(neighbor)
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = neighbors[k]
+            if not self.visited[neighbor]:
+                self.visited[neighbor] = 1
                 self.scanned_tiles += 1
 
                 self.queue.append(neighbor)
 
                 self.parent[neighbor] = current
 
-                row, col = neighbor
-                if neighbor != self.start_coords and neighbor != self.goal_coords:
+                if neighbor != self.start_index and neighbor != self.goal_index:
+                    row, col = self.board.cell_as_coordinates(neighbor)
                     self.board.set_cell(row, col, CellMark.SCANNED)
 
         return False
 
-    def _reconstruct_path(self):
-        """Reconstruct the path from start to goal using the parent dictionary."""
-        current = self.goal_coords
-        path = []
-
-        while current != self.start_coords:
-            path.append(current)
-            current = self.parent[current]
+    def _run(self, limit: float, mark_board: bool) -> bool:
+        """Runs BFS without per tick overhead, used by solve()."""
+        queue = self.queue
+        visited = self.visited
+        parent = self.parent
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+        start, goal = self.start_index, self.goal_index
+        width = self.board.width
+        set_cell = self.board.set_cell
+        scanned = self.scanned_tiles
+
+        while queue and not self.found_goal and scanned < limit:
+            current = queue.popleft()
+
+            if current == goal:
+                self.found_goal = True
+                break
+
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[k]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    scanned += 1
+                    queue.append(neighbor)
+                    parent[neighbor] = current
+
+                    if mark_board and neighbor != start and neighbor != goal:
+                        set_cell(neighbor // width, neighbor % width, CellMark.SCANNED)
+
+        self.scanned_tiles = scanned
+
+        if not self.found_goal:
+            return False
 
-        path.append(self.start_coords)
-        path.reverse()
+        if not self.reconstructed_path:
+            self.solution_path = self._trace_path(parent, start, goal)
+            self.reconstructed_path = True
+            if mark_board:
+                self._mark_path(self.solution_path)
 
-        self.solution_path = [row * self.board.width + col for row, col in path]
+        return True
 
-        for position in path:
-            row, col = position
-            if position != self.start_coords and position != self.goal_coords:
-                self.board.set_cell(row, col, CellMark.PATH)
+    def _reconstruct_path(self):
+        """Reconstruct the path from start to goal using the parent array."""
+        self.solution_path = self._trace_path(
+            self.parent, self.start_index, self.goal_index
+        )
+        self._mark_path(self.solution_path)
 
-        print(f"Path found! Length: {len(path)}")
+        print(f"Path found! Length: {len(self.solution_path)}")
         print(f"Tiles scanned: {self.scanned_tiles}")
 
     def get_scanned_tiles(self) -> int:
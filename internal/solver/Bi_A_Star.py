@@ -0,0 +1,136 @@
+from ..maze.maze import MazeBoard, CellMark
+from .solver import Solver, cell_array, unreached
+
+import heapq
+
+# Sides of the search
+FORWARD = 0
+BACKWARD = 1
+
+
+class Bi_A_Star(Solver):
+    """
+    Bidirectional A* with average potentials. Both sides rank cells by their
+    cost plus half the difference of the Manhattan distances to the goal and
+    to the start (doubled to stay in integers), which keeps the two searches
+    consistent with each other. Every tick expands the side with the smaller
+    open set, and the search stops once the smallest keys of both open sets
+    add up to twice the best meeting found.
+    """
+
+    def __init__(self, board: MazeBoard, start: int, goal: int):
+        super().__init__(board, start, goal)
+        self.adjacency = board.adjacency()
+
+        self.start = start
+        self.goal = goal
+        self.start_coords = self.board.cell_as_coordinates(start)
+        self.goal_coords = self.board.cell_as_coordinates(goal)
+
+        size = board.height * board.width
+
+        # Per side priority queues of (key, count, index), count breaks ties
+        self.open_sets = ([], [])
+        self.open_set_counter = 0
+
+        # Cost of cells not reached yet
+        self.unreached = unreached(size)
+        self.g_scores = (
+            cell_array(size, self.unreached),
+            cell_array(size, self.unreached),
+        )
+        self.came_from = (cell_array(size), cell_array(size))
+        self.closed = (bytearray(size), bytearray(size))
+
+        for side, origin in ((FORWARD, start), (BACKWARD, goal)):
+            self.g_scores[side][origin] = 0
+            heapq.heappush(
+                self.open_sets[side],
+                (self._heuristic(side, origin), self.open_set_counter, origin),
+            )
+            self.open_set_counter += 1
+
+        # Length of the best path found so far and the cell where both sides meet
+        self.best_cost = 0 if start == goal else self.unreached
+        self.meeting = start
+
+    def _heuristic(self, side, index):
+        """
+        Doubled average potential of a side: distance to its target minus
+        distance to its origin, both Manhattan.
+        """
+        row, col = divmod(index, self.board.width)
+        to_goal = abs(row - self.goal_coords[0]) + abs(col - self.goal_coords[1])
+        to_start = abs(row - self.start_coords[0]) + abs(col - self.start_coords[1])
+        if side == FORWARD:
+            return to_goal - to_start
+        return to_start - to_goal
+
+    def _step(self, mark_board: bool) -> bool:
+        """Expands one cell, returns True once the search is over."""
+        forward, backward = self.open_sets
+        if not forward or not backward:
+            return True
+
+        # No unexplored path can beat the best meeting anymore
+        if forward[0][0] + backward[0][0] >= 2 * self.best_cost:
+            return True
+
+        side = FORWARD if len(forward) <= len(backward) else BACKWARD
+        other = 1 - side
+        open_set = self.open_sets[side]
+        closed = self.closed[side]
+        g_score = self.g_scores[side]
+        other_g_score = self.g_scores[other]
+        came_from = self.came_from[side]
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+
+        _, _, current = heapq.heappop(open_set)
+        if closed[current]:
+            return False  # Stale entry of an improved cell
+
+        closed[current] = 1
+        self.scanned_tiles += 1
+
+        if mark_board and current != self.start and current != self.goal:
+            row, col = self.board.cell_as_coordinates(current)
+            self.board.set_cell(row, col, CellMark.SCANNED)
+
+        tentative_g_score = g_score[current] + 1
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = neighbors[k]
+            if closed[neighbor] or tentative_g_score >= g_score[neighbor]:
+                continue
+
+            g_score[neighbor] = tentative_g_score
+            came_from[neighbor] = current
+            heapq.heappush(
+                open_set,
+                (
+                    2 * tentative_g_score + self._heuristic(side, neighbor),
+                    self.open_set_counter,
+                    neighbor,
+                ),
+            )
+            self.open_set_counter += 1
+
+            cost = tentative_g_score + other_g_score[neighbor]
+            if cost < self.best_cost:
+                self.best_cost = cost
+                self.meeting = neighbor
+
+        return False
+
+    def _finish(self, mark_board: bool):
+        """Joins both halves of the path through the meeting cell."""
+        if self.best_cost == self.unreached:
+            return
+
+        path = self._trace_path(self.came_from[FORWARD], self.start, self.meeting)
+        backward = self._trace_path(self.came_from[BACKWARD], self.goal, self.meeting)
+        path.extend(reversed(backward[:-1]))
+
+        self.solution_path = path
+        if mark_board:
+            self._mark_path(path)
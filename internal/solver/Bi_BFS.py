@@ -0,0 +1,122 @@
+from collections import deque
+from ..maze.maze import MazeBoard, CellMark
+from .solver import Solver, cell_array
+
+# Sides of the search, also used as bits of the `seen` bytearray
+FORWARD = 0
+BACKWARD = 1
+
+
+class Bi_BFS(Solver):
+    """
+    Bidirectional breadth first search. Two BFS frontiers grow from the start
+    and the goal, a whole layer at a time, from the side with the smaller
+    frontier. Once they touch, the current layer is finished so the shortest
+    of the meeting points is kept.
+    """
+
+    def __init__(self, board: MazeBoard, start: int, goal: int):
+        super().__init__(board, start, goal)
+        self.adjacency = board.adjacency()
+
+        self.start_index = start
+        self.goal_index = goal
+
+        size = board.height * board.width
+        self.queues = (deque([start]), deque([goal]))
+        self.parents = (cell_array(size), cell_array(size))
+        self.distances = (cell_array(size), cell_array(size))
+
+        # Bit FORWARD/BACKWARD is set once a side has queued the cell
+        self.seen = bytearray(size)
+        self.seen[start] |= 1 << FORWARD
+        self.seen[goal] |= 1 << BACKWARD
+        self.distances[FORWARD][start] = 0
+        self.distances[BACKWARD][goal] = 0
+
+        self.side = FORWARD
+        self.layer_left = 1  # Cells left to expand in the current layer of `side`
+
+        # Best meeting found so far: path length and the (forward, backward) cells
+        self.best_length = 0 if start == goal else None
+        self.meeting = (start, goal)
+
+        self.scanned_tiles = 0
+        self.solution_path = []
+
+    def _step(self, mark_board: bool) -> bool:
+        """Expands one cell, returns True once the search is over."""
+        if self.layer_left == 0:
+            # A meeting found in the finished layer can't be beaten anymore
+            if self.best_length is not None:
+                return True
+
+            forward, backward = self.queues
+            if not forward or not backward:
+                return True
+
+            self.side = FORWARD if len(forward) <= len(backward) else BACKWARD
+            self.layer_left = len(self.queues[self.side])
+
+        side = self.side
+        other = 1 - side
+        side_bit = 1 << side
+        other_bit = 1 << other
+        queue = self.queues[side]
+        parent = self.parents[side]
+        distance = self.distances[side]
+        other_distance = self.distances[other]
+        seen = self.seen
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+
+        current = queue.popleft()
+        self.layer_left -= 1
+        next_distance = distance[current] + 1
+
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = neighbors[k]
+            neighbor_seen = seen[neighbor]
+
+            if neighbor_seen & other_bit:
+                length = next_distance + other_distance[neighbor]
+                if self.best_length is None or length < self.best_length:
+                    self.best_length = length
+                    if side == FORWARD:
+                        self.meeting = (current, neighbor)
+                    else:
+                        self.meeting = (neighbor, current)
+
+            if not neighbor_seen & side_bit:
+                seen[neighbor] = neighbor_seen | side_bit
+                distance[neighbor] = next_distance
+                parent[neighbor] = current
+                queue.append(neighbor)
+                self.scanned_tiles += 1
+
+                if (
+                    mark_board
+                    and neighbor != self.start_index
+                    and neighbor != self.goal_index
+                ):
+                    row, col = self.board.cell_as_coordinates(neighbor)
+                    self.board.set_cell(row, col, CellMark.SCANNED)
+
+        return False
+
+    def _finish(self, mark_board: bool):
+        """Joins both halves of the path through the best meeting point."""
+        if self.best_length is None:
+            return
+
+        forward_cell, backward_cell = self.meeting
+        path = self._trace_path(self.parents[FORWARD], self.start_index, forward_cell)
+        if backward_cell != forward_cell:
+            backward = self._trace_path(
+                self.parents[BACKWARD], self.goal_index, backward_cell
+            )
+            path.extend(reversed(backward))
+
+        self.solution_path = path
+        if mark_board:
+            self._mark_path(path)
@@ -1,32 +1,31 @@
 from enum import StrEnum
 from typing import Tuple
 from ..maze.maze import MazeBoard, CellMark
-from .solver import Solver
+from .solver import Solver, cell_array
 
 
 class DFS(Solver):
 
     def __init__(self, board: MazeBoard, start: int, goal: int):
         super().__init__(board, start, goal)
+        self.adjacency = board.adjacency()
         self.start = start
         self.goal = goal
 
         # Initialize stack for DFS
         self.stack = []
 
-        # Convert 1D indices to 2D coordinates
-        start_coords = self.board.cell_as_coordinates(start)
-        goal_coords = self.board.cell_as_coordinates(goal)
-
         # Add start position to the stack
-        self.stack.append(start_coords)
+        self.stack.append(start)
+
+        size = board.height * board.width
 
         # Track visited cells to avoid cycles
-        self.visited = set()
-        self.visited.add(start)
+        self.visited = bytearray(size)
+        self.visited[start] = 1
 
         # For path reconstruction
-        self.came_from = {}
+        self.came_from = cell_array(size)
 
         # Flag to indicate if we've reached the goal
         self.goal_reached = False
@@ -34,9 +33,6 @@ class DFS(Solver):
         # Flag to indicate if we're in backtracking mode
         self.backtracking = False
 
-        # Store the goal for easy reference
-        self.goal_coords = goal_coords
-
     def solve_tick(self) -> bool:
         # If we've already reached the goal and reconstructed the path, we're done
         if self.goal_reached:
@@ -48,38 +44,30 @@ class DFS(Solver):
 
         # Get the current position from the top of the stack
         current = self.stack[-1]
-        current_row, current_col = current
 
         # If we've reached the goal
-        if current == self.goal_coords:
+        if current == self.goal:
             # We've found the goal! Now reconstruct the path
             self.goal_reached = True
             self._reconstruct_path()
             return True
 
         # Mark current cell as scanned (if it's not the start or end)
-        if self.board.get_cell(current_row, current_col) not in [
-            CellMark.START,
-            CellMark.END,
-        ]:
+        if current != self.start:
+            current_row, current_col = self.board.cell_as_coordinates(current)
             self.board.set_cell(current_row, current_col, CellMark.SCANNED)
             self.scanned_tiles += 1
 
-        # Get unvisited neighbors
-        neighbors = self._get_unvisited_neighbors(current)
-
-        if neighbors:
-            # Choose the first unvisited neighbor
-            next_cell = neighbors[0]
-            next_row, next_col = next_cell
-            next_index = self.board.cords_as_cell(next_cell)
+        # Get the first unvisited neighbor
+        next_index = self._get_unvisited_neighbor(current)
 
+        if next_index is not None:
             # Mark it as visited and add to stack
-            self.visited.add(next_index)
-            self.stack.append(next_cell)
+            self.visited[next_index] = 1
+            self.stack.append(next_index)
 
             # Record where we came from (for path reconstruction)
-            self.came_from[next_index] = self.board.cords_as_cell(current)
+            self.came_from[next_index] = current
 
             return False  # Not done yet
         else:
@@ -87,44 +75,58 @@ class DFS(Solver):
             self.stack.pop()
             return False  # Not done yet
 
-    def _get_unvisited_neighbors(self, position):
-        """Get all valid unvisited neighbors of the current position."""
-        row, col = position
-        neighbors = []
-
-        # Define the four possible directions (up, right, down, left)
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-
-            # Check if the new position is valid
-            if not self.board._valid_coords(new_row, new_col):
-                continue
-
-            # Get the cell mark at the new position
-            cell = self.board.get_cell(new_row, new_col)
-
-            # Check if the new position is a valid move
-            if cell in [CellMark.EMPTY, CellMark.END]:
-                # Convert to index and check if already visited
-                index = self.board.cords_as_cell((new_row, new_col))
-                if index not in self.visited:
-                    neighbors.append((new_row, new_col))
-
-        return neighbors
+    def _get_unvisited_neighbor(self, index):
+        """Get the first unvisited neighbor (up, right, down, left) of a cell."""
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+
+        for k in range(offsets[index], offsets[index + 1]):
+            if not self.visited[neighbors[k]]:
+                return neighbors[k]
+
+        return None
+
+    def _run(self, limit: float, mark_board: bool) -> bool:
+        """Runs DFS without per tick overhead, used by solve()."""
+        stack = self.stack
+        visited = self.visited
+        came_from = self.came_from
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+        start, goal = self.start, self.goal
+        width = self.board.width
+        set_cell = self.board.set_cell
+        scanned = self.scanned_tiles
+
+        while stack and not self.goal_reached and scanned < limit:
+            current = stack[-1]
+
+            if current == goal:
+                self.goal_reached = True
+                self.solution_path = self._trace_path(came_from, start, goal)
+                if mark_board:
+                    self._mark_path(self.solution_path)
+                break
+
+            if current != start:
+                if mark_board:
+                    set_cell(current // width, current % width, CellMark.SCANNED)
+                scanned += 1
+
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[k]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    stack.append(neighbor)
+                    came_from[neighbor] = current
+                    break
+            else:
+                stack.pop()
+
+        self.scanned_tiles = scanned
+        return self.goal_reached
 
     def _reconstruct_path(self):
         """Reconstruct the path from start to goal."""
-        current = self.goal
-        start_index = self.start
-
-        while current != start_index:
-            current_coords = self.board.cell_as_coordinates(current)
-            row, col = current_coords
-
-            # Mark the cell as part of the path (except start and end)
-            if self.board.get_cell(row, col) not in [CellMark.START, CellMark.END]:
-                self.board.set_cell(row, col, CellMark.PATH)
-
-            current = self.came_from[current]
+        self.solution_path = self._trace_path(self.came_from, self.start, self.goal)
+        self._mark_path(self.solution_path)
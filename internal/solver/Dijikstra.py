@@ -1,13 +1,14 @@
 from typing import List, Tuple, Dict
 import heapq
 from ..maze.maze import MazeBoard, CellMark
-from .solver import Solver
+from .solver import Solver, cell_array, unreached
 
 
 class Dijikstra(Solver):
     def __init__(self, board: MazeBoard, start: int, goal: int):
         super().__init__(board, start, goal)
         self.board = board
+        self.adjacency = board.adjacency()
 
         self.start_index = start
         self.goal_index = goal
@@ -15,35 +16,23 @@ class Dijikstra(Solver):
         self.start_coords = self.board.cell_as_coordinates(start)
         self.goal_coords = self.board.cell_as_coordinates(goal)
 
-        self.distances = {}
-        self.previous = {}
+        size = board.height * board.width
+        self.distances = cell_array(size, unreached(size))
+        self.previous = cell_array(size)
         self.priority_queue = []
-        self.visited = set()
+        self.visited = bytearray(size)  # 1 once a cell has been settled
 
-        self.distances[self.start_coords] = 0
-        heapq.heappush(self.priority_queue, (0, self.start_coords))
+        self.distances[start] = 0
+        heapq.heappush(self.priority_queue, (0, start))
 
         self.scanned_tiles = 0
         self.solution_path = []
         self.found_goal = False
         self.reconstructed_path = False
 
-    def get_neighbors(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get valid neighboring cells (up, down, left, right)."""
-        row, col = position
-        neighbors = []
-
-        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            new_row, new_col = row + dr, col + dc
-
-            if (
-                0 <= new_row < self.board.height
-                and 0 <= new_col < self.board.width
-                and self.board.get_cell(new_row, new_col) != CellMark.WALL
-            ):
-                neighbors.append((new_row, new_col))
-
-        return neighbors
+    def get_neighbors(self, index: int) -> List[int]:
+        """Get valid neighboring cells (up, right, down, left)."""
+        return list(self.adjacency.neighbors_of(index))
 
     def solve_tick(self) -> bool:
         """Perform one step of Dijkstra's algorithm."""
@@ -59,55 +48,94 @@ class Dijikstra(Solver):
             print("No path found to the goal!")
             return True
 
-        current_distance, current_position = heapq.heappop(self.priority_queue)
+        current_distance, current = heapq.heappop(self.priority_queue)
 
-        if current_position in self.visited:
+        if self.visited[current]:
             return False
 
-        self.visited.add(current_position)
+        self.visited[current] = 1
         self.scanned_tiles += 1
 
-        row, col = current_position
-        if (
-            current_position != self.start_coords
-            and current_position != self.goal_coords
-        ):
+        if current != self.start_index and current != self.goal_index:
+            row, col = self.board.cell_as_coordinates(current)
             self.board.set_cell(row, col, CellMark.SCANNED)
 
-        if current_position == self.goal_coords:
+        if current == self.goal_index:
             self.found_goal = True
             return False
 
-        for neighbor in self.get_neighbors(current_position):
-            distance = current_distance + 1
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+        distance = current_distance + 1
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = neighbors[k]
 
-            if neighbor not in self.distances or distance < self.distances[neighbor]:
+            if distance < self.distances[neighbor]:
                 self.distances[neighbor] = distance
-                self.previous[neighbor] = current_position
+                self.previous[neighbor] = current
                 heapq.heappush(self.priority_queue, (distance, neighbor))
 
         return False
 
-    def _reconstruct_path(self):
-        """Reconstruct the path from start to goal using the previous dictionary."""
-        current = self.goal_coords
-        path = []
+    def _run(self, limit: float, mark_board: bool) -> bool:
+        """Runs Dijkstra without per tick overhead, used by solve()."""
+        priority_queue = self.priority_queue
+        visited = self.visited
+        distances = self.distances
+        previous = self.previous
+        offsets = self.adjacency.offsets
+        neighbors = self.adjacency.neighbors
+        start, goal = self.start_index, self.goal_index
+        width = self.board.width
+        set_cell = self.board.set_cell
+        heappop, heappush = heapq.heappop, heapq.heappush
+        scanned = self.scanned_tiles
+
+        while priority_queue and not self.found_goal and scanned < limit:
+            current_distance, current = heappop(priority_queue)
+
+            if visited[current]:
+                continue
+
+            visited[current] = 1
+            scanned += 1
 
-        while current != self.start_coords:
-            path.append(current)
-            current = self.previous[current]
+            if mark_board and current != start and current != goal:
+                set_cell(current // width, current % width, CellMark.SCANNED)
 
-        path.append(self.start_coords)
-        path.reverse()
+            if current == goal:
+                self.found_goal = True
+                break
 
-        self.solution_path = [row * self.board.width + col for row, col in path]
+            distance = current_distance + 1
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[k]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous[neighbor] = current
+                    heappush(priority_queue, (distance, neighbor))
+
+        self.scanned_tiles = scanned
+
+        if not self.found_goal:
+            return False
 
-        for position in path:
-            row, col = position
-            if position != self.start_coords and position != self.goal_coords:
-                self.board.set_cell(row, col, CellMark.PATH)
+        if not self.reconstructed_path:
+            self.solution_path = self._trace_path(previous, start, goal)
+            self.reconstructed_path = True
+            if mark_board:
+                self._mark_path(self.solution_path)
+
+        return True
+
+    def _reconstruct_path(self):
+        """Reconstruct the path from start to goal using the previous array."""
+        self.solution_path = self._trace_path(
+            self.previous, self.start_index, self.goal_index
+        )
+        self._mark_path(self.solution_path)
 
-        print(f"Path found! Length: {len(path)}")
+        print(f"Path found! Length: {len(self.solution_path)}")
         print(f"Tiles scanned: {self.scanned_tiles}")
 
     def get_scanned_tiles(self) -> int:
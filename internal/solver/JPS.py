@@ -0,0 +1,157 @@
+from ..maze.maze import MazeBoard, CellMark, AdjacencyIndex
+from .solver import Solver, cell_array, unreached, NO_CELL
+
+import heapq
+
+NORTH = AdjacencyIndex.NORTH
+SOUTH = AdjacencyIndex.SOUTH
+EAST = AdjacencyIndex.EAST
+WEST = AdjacencyIndex.WEST
+
+REVERSE = {NORTH: SOUTH, SOUTH: NORTH, EAST: WEST, WEST: EAST}
+
+# Open sides that turn a cell reached moving in a direction into a jump point
+PERPENDICULAR = {
+    NORTH: (1 << EAST) | (1 << WEST),
+    SOUTH: (1 << EAST) | (1 << WEST),
+    EAST: (1 << NORTH) | (1 << SOUTH),
+    WEST: (1 << NORTH) | (1 << SOUTH),
+}
+
+
+class JPS(Solver):
+    """
+    Jump Point Search for 4-connected grids. From every jump point the
+    search walks straight along each open direction (except back where it
+    came from) until it reaches the goal or a cell with a perpendicular
+    opening, which becomes the next jump point. Corridors are crossed in a
+    single expansion and dead ends are never pushed into the open set.
+
+    scanned_tiles counts every cell walked over by the jumps, so it stays
+    comparable with the per cell expansions of the other solvers.
+    """
+
+    def __init__(self, board: MazeBoard, start: int, goal: int):
+        super().__init__(board, start, goal)
+        self.adjacency = board.adjacency()
+
+        self.start = start
+        self.goal = goal
+        self.goal_coords = self.board.cell_as_coordinates(goal)
+
+        width = board.width
+        self.steps = {NORTH: -width, SOUTH: width, EAST: 1, WEST: -1}
+
+        size = board.height * board.width
+
+        # Priority queue of jump points - stores (f_score, count, index)
+        self.open_set = []
+        self.open_set_counter = 0
+
+        self.g_score = cell_array(size, unreached(size))
+        self.came_from = cell_array(size)  # Previous jump point
+        self.closed = bytearray(size)
+
+        self.g_score[start] = 0
+        heapq.heappush(self.open_set, (self._heuristic(start), 0, start))
+        self.open_set_counter += 1
+
+        self.goal_reached = False
+
+    def _heuristic(self, index):
+        """Manhattan distance heuristic"""
+        row, col = divmod(index, self.board.width)
+        return abs(row - self.goal_coords[0]) + abs(col - self.goal_coords[1])
+
+    def _step(self, mark_board: bool) -> bool:
+        """Expands the best jump point, returns True once the search is over."""
+        if not self.open_set:
+            return True
+
+        _, _, current = heapq.heappop(self.open_set)
+        if self.closed[current]:
+            return False  # Stale entry of an improved jump point
+
+        if current == self.goal:
+            self.goal_reached = True
+            return True
+
+        self.closed[current] = 1
+
+        parent = self.came_from[current]
+        arrival = None if parent == NO_CELL else self._direction(parent, current)
+
+        for direction in (NORTH, EAST, SOUTH, WEST):
+            if arrival is not None and direction == REVERSE[arrival]:
+                continue
+
+            jump_point, distance = self._jump(current, direction, mark_board)
+            if jump_point is None:
+                continue
+
+            tentative_g_score = self.g_score[current] + distance
+            if tentative_g_score < self.g_score[jump_point]:
+                self.g_score[jump_point] = tentative_g_score
+                self.came_from[jump_point] = current
+                heapq.heappush(
+                    self.open_set,
+                    (
+                        tentative_g_score + self._heuristic(jump_point),
+                        self.open_set_counter,
+                        jump_point,
+                    ),
+                )
+                self.open_set_counter += 1
+
+        return False
+
+    def _jump(self, index: int, direction: int, mark_board: bool):
+        """
+        Walks from a cell in one direction. Returns the jump point reached and
+        its distance, or (None, 0) if the walk ends on a wall.
+        """
+        directions = self.adjacency.directions
+        step = self.steps[direction]
+        open_bit = 1 << direction
+        perpendicular = PERPENDICULAR[direction]
+        goal = self.goal
+        width = self.board.width
+
+        current = index
+        distance = 0
+        while directions[current] & open_bit:
+            current += step
+            distance += 1
+            self.scanned_tiles += 1
+
+            if current == goal:
+                return current, distance
+
+            if mark_board and current != self.start:
+                self.board.set_cell(current // width, current % width, CellMark.SCANNED)
+
+            if directions[current] & perpendicular:
+                return current, distance
+
+        return None, 0
+
+    def _direction(self, source: int, target: int) -> int:
+        """Direction of the straight line going from source to target"""
+        if source // self.board.width == target // self.board.width:
+            return EAST if target > source else WEST
+        return SOUTH if target > source else NORTH
+
+    def _finish(self, mark_board: bool):
+        """Expands the chain of jump points into the full cell path."""
+        if not self.goal_reached:
+            return
+
+        jump_points = self._trace_path(self.came_from, self.start, self.goal)
+        path = [self.start]
+        for source, target in zip(jump_points, jump_points[1:]):
+            step = self.steps[self._direction(source, target)]
+            path.extend(range(source + step, target + step, step))
+
+        self.solution_path = path
+        if mark_board:
+            self._mark_path(path)
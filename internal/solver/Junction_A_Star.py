@@ -0,0 +1,186 @@
+from ..maze.maze import MazeBoard, CellMark
+from ..maze.junction_graph import NO_NODE, NO_EDGE
+from .solver import Solver, cell_array, unreached
+
+import heapq
+
+
+class Junction_A_Star(Solver):
+    """
+    A* over the junction graph of the maze, where every corridor is a single
+    weighted edge. Start and goal cells lying inside a corridor become extra
+    nodes splitting it. The node path found is expanded back into cells.
+
+    scanned_tiles counts expanded graph nodes.
+    """
+
+    def __init__(self, board: MazeBoard, start: int, goal: int):
+        super().__init__(board, start, goal)
+        self.graph = board.junction_graph()
+
+        self.start = start
+        self.goal = goal
+        self.goal_coords = self.board.cell_as_coordinates(goal)
+
+        node_count = self.graph.node_count()
+        self.start_node = self._endpoint_node(start, node_count)
+        self.goal_node = self._endpoint_node(goal, node_count + 1)
+
+        size = node_count + 2
+
+        # Priority queue of nodes - stores (f_score, count, node)
+        self.open_set = []
+        self.open_set_counter = 0
+
+        # Costs are counted in cells of the maze, not in nodes
+        cells = board.height * board.width
+        self.g_score = cell_array(size, unreached(cells), cells)
+        self.came_from = cell_array(size)
+        # Edge and positions along it of the hop that reached every node
+        self.via_edge = cell_array(size)
+        self.via_source = cell_array(size, 0)
+        self.via_target = cell_array(size, 0)
+        self.closed = bytearray(size)
+
+        if self.start_node != NO_NODE:
+            self.g_score[self.start_node] = 0
+            heapq.heappush(self.open_set, (self._heuristic(start), 0, self.start_node))
+            self.open_set_counter += 1
+
+        self.goal_reached = False
+
+    def _endpoint_node(self, cell: int, virtual: int) -> int:
+        """Node of the start or goal, `virtual` if it sits inside a corridor."""
+        if self.graph.cell_node[cell] != NO_NODE:
+            return self.graph.cell_node[cell]
+        if self.graph.cell_edge[cell] != NO_EDGE:
+            return virtual
+        return NO_NODE
+
+    def _heuristic(self, cell):
+        """Manhattan distance heuristic"""
+        row, col = divmod(cell, self.board.width)
+        return abs(row - self.goal_coords[0]) + abs(col - self.goal_coords[1])
+
+    def _node_cell(self, node: int) -> int:
+        if node == self.start_node:
+            return self.start
+        if node == self.goal_node:
+            return self.goal
+        return self.graph.node_cells[node]
+
+    def _hops(self, node: int):
+        """Yields (node, weight, edge, source position, target position) leaving a node"""
+        graph = self.graph
+
+        if node == self.start_node and graph.cell_node[self.start] == NO_NODE:
+            edge = graph.cell_edge[self.start]
+            position = graph.cell_position[self.start]
+            weight = graph.edge_weight[edge]
+            yield graph.edge_u[edge], position, edge, position, 0
+            yield graph.edge_v[edge], weight - position, edge, position, weight
+            if graph.cell_edge[self.goal] == edge and self.goal != self.start:
+                goal_position = graph.cell_position[self.goal]
+                yield (
+                    self.goal_node,
+                    abs(goal_position - position),
+                    edge,
+                    position,
+                    goal_position,
+                )
+            return
+
+        goal_edge = NO_EDGE
+        if graph.cell_node[self.goal] == NO_NODE:
+            goal_edge = graph.cell_edge[self.goal]
+
+        for k in range(graph.node_offsets[node], graph.node_offsets[node + 1]):
+            edge = graph.node_edges[k]
+            weight = graph.edge_weight[edge]
+            goal_position = graph.cell_position[self.goal]
+
+            if graph.edge_u[edge] == node:
+                yield graph.edge_v[edge], weight, edge, 0, weight
+                if edge == goal_edge:
+                    yield self.goal_node, goal_position, edge, 0, goal_position
+            if graph.edge_v[edge] == node:
+                yield graph.edge_u[edge], weight, edge, weight, 0
+                if edge == goal_edge:
+                    yield (
+                        self.goal_node,
+                        weight - goal_position,
+                        edge,
+                        weight,
+                        goal_position,
+                    )
+
+    def _step(self, mark_board: bool) -> bool:
+        """Expands the best node, returns True once the search is over."""
+        if self.start == self.goal:
+            self.goal_reached = True
+            return True
+
+        if not self.open_set:
+            return True
+
+        _, _, current = heapq.heappop(self.open_set)
+        if self.closed[current]:
+            return False  # Stale entry of an improved node
+
+        if current == self.goal_node:
+            self.goal_reached = True
+            return True
+
+        self.closed[current] = 1
+        self.scanned_tiles += 1
+
+        cell = self._node_cell(current)
+        if mark_board and cell != self.start:
+            row, col = self.board.cell_as_coordinates(cell)
+            self.board.set_cell(row, col, CellMark.SCANNED)
+
+        g_score = self.g_score[current]
+        for node, weight, edge, source, target in self._hops(current):
+            if self.closed[node]:
+                continue
+
+            tentative_g_score = g_score + weight
+            if tentative_g_score < self.g_score[node]:
+                self.g_score[node] = tentative_g_score
+                self.came_from[node] = current
+                self.via_edge[node] = edge
+                self.via_source[node] = source
+                self.via_target[node] = target
+                heapq.heappush(
+                    self.open_set,
+                    (
+                        tentative_g_score + self._heuristic(self._node_cell(node)),
+                        self.open_set_counter,
+                        node,
+                    ),
+                )
+                self.open_set_counter += 1
+
+        return False
+
+    def _finish(self, mark_board: bool):
+        """Expands the node path into the cells of the corridors it takes."""
+        if not self.goal_reached:
+            return
+
+        if self.start == self.goal:
+            self.solution_path = [self.start]
+            return
+
+        nodes = self._trace_path(self.came_from, self.start_node, self.goal_node)
+        path = [self.start]
+        for node in nodes[1:]:
+            path.extend(
+                self.graph.edge_segment(
+                    self.via_edge[node], self.via_source[node], self.via_target[node]
+                )
+            )
+
+        self.solution_path = path
+        if mark_board:
+            self._mark_path(path)
@@ -1,4 +1,45 @@
-from ..maze.maze import MazeBoard
+from array import array
+from dataclasses import dataclass
+from ..maze.maze import MazeBoard, CellMark
+import time
+
+# Marks an unset entry of a cell array
+NO_CELL = -1
+
+
+def cell_typecode(cells: int) -> str:
+    """Array typecode of integers up to the number of cells of a maze"""
+    return "i" if cells < 2**31 else "q"
+
+
+def unreached(cells: int) -> int:
+    """
+    Distance of cells not reached yet in a maze of `cells` cells: the largest
+    value of its cell arrays, above any real distance in it.
+    """
+    return 2**31 - 1 if cell_typecode(cells) == "i" else 2**63 - 1
+
+
+def cell_array(size: int, fill: int = NO_CELL, cells: int = None) -> array:
+    """
+    Preallocates one machine integer per cell, used by solvers to store
+    parents and distances indexed by flat cell index. Arrays of fewer
+    entries than cells, such as per junction ones, pass the `cells` of the
+    maze so they hold any distance in it.
+    """
+    typecode = cell_typecode(size if cells is None else cells)
+    return array(typecode, [fill]) * size
+
+
+@dataclass
+class SolveResult:
+    """Outcome of running a solver to completion with Solver.solve()"""
+
+    path: list[int]
+    length: int
+    expansions: int
+    elapsed: float
+    found: bool
 
 
 class Solver:
@@ -7,6 +48,8 @@ class Solver:
         # YOU ARE RESPONSABLE FOR UPDATING THIS VARIABLES:
         self.solution_path = []
         self.scanned_tiles = 0
+        # Set once the search is over, by the _step() driver
+        self.finished = False
 
     def get_scanned_tiles(self) -> int:
         return self.scanned_tiles
@@ -28,5 +71,79 @@ class Solver:
             Tuple[MazeBoard, bool]: A tuple containing:
                 - MazeBoard: The current state of the maze after the tick.
                 - bool: True if the goal is reached, otherwise False.
+
+        Solvers may instead implement _step() and _finish(), driven by this
+        and _run() alike.
+        """
+        if self.finished:
+            return True
+
+        if self._step(True):
+            self.finished = True
+            self._finish(True)
+            if not self.solution_path:
+                print("No solution exists")
+            return True
+
+        return False
+
+    def solve(
+        self, max_expansions: int | None = None, mark_board: bool = False
+    ) -> SolveResult:
+        """
+        Runs the solver until it finishes or scans `max_expansions` tiles.
+
+        Unlike solve_tick() the board is left untouched unless `mark_board`
+        is set. A solver stopped by `max_expansions` can be resumed by calling
+        solve() again.
+        """
+        limit = max_expansions if max_expansions is not None else float("inf")
+
+        started = time.perf_counter()
+        found = self._run(limit, mark_board)
+        elapsed = time.perf_counter() - started
+
+        return SolveResult(
+            path=self.solution_path,
+            length=len(self.solution_path),
+            expansions=self.scanned_tiles,
+            elapsed=elapsed,
+            found=found,
+        )
+
+    def _run(self, limit: float, mark_board: bool) -> bool:
         """
-        raise NotImplementedError("Subclasses should implement solve_tick()")
+        Inner loop of solve(), returns True if the goal was reached.
+        Subclasses override it with a tight loop; this fallback drives _step().
+        """
+        while not self.finished and self.scanned_tiles < limit:
+            if self._step(mark_board):
+                self.finished = True
+                self._finish(mark_board)
+        return bool(self.solution_path)
+
+    def _step(self, mark_board: bool) -> bool:
+        """
+        Expands one tile, or one node for graph searches, marking the board
+        if `mark_board` is set. Returns True once the search is over.
+        """
+        raise NotImplementedError("Subclasses should implement solve_tick() or _step()")
+
+    def _finish(self, mark_board: bool):
+        """Builds solution_path once _step() ended the search, if it reached the goal"""
+
+    def _trace_path(self, parents, start: int, goal: int) -> list[int]:
+        """Follows `parents` back from goal and returns the start to goal path"""
+        path = [goal]
+        current = goal
+        while current != start:
+            current = parents[current]
+            path.append(current)
+        path.reverse()
+        return path
+
+    def _mark_path(self, path: list[int]):
+        """Marks every cell of a path as PATH, leaving its start and end intact"""
+        for index in path[1:-1]:
+            row, col = self.board.cell_as_coordinates(index)
+            self.board.set_cell(row, col, CellMark.PATH)
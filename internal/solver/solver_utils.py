@@ -2,6 +2,10 @@ from .BFS import BFS
 from .DFS import DFS
 from .Dijikstra import Dijikstra
 from .A_Star import A_Star
+from .Bi_BFS import Bi_BFS
+from .Bi_A_Star import Bi_A_Star
+from .JPS import JPS
+from .Junction_A_Star import Junction_A_Star
 from enum import StrEnum
 from ..maze.maze import MazeBoard
 
@@ -11,6 +15,10 @@ class SolverType(StrEnum):
     DFS = "DFS"
     DIJIKSTRA = "Dijikstra"
     A_STAR = "A*"
+    BI_BFS = "Bi-BFS"
+    BI_A_STAR = "Bi-A*"
+    JPS = "JPS"
+    JUNCTION_A_STAR = "Junction A*"
 
 
 def SolverFromType(sType: SolverType, board: MazeBoard, start: int, goal: int):
@@ -22,3 +30,11 @@ def SolverFromType(sType: SolverType, board: MazeBoard, start: int, goal: int):
         return Dijikstra(board, start, goal)
     elif sType == SolverType.A_STAR:
         return A_Star(board, start, goal)
+    elif sType == SolverType.BI_BFS:
+        return Bi_BFS(board, start, goal)
+    elif sType == SolverType.BI_A_STAR:
+        return Bi_A_Star(board, start, goal)
+    elif sType == SolverType.JPS:
+        return JPS(board, start, goal)
+    elif sType == SolverType.JUNCTION_A_STAR:
+        return Junction_A_Star(board, start, goal)
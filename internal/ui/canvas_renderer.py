@@ -0,0 +1,54 @@
+import tkinter as tk
+from array import array
+
+from internal.maze.maze import MazeBoard, CellMark
+from .renderer import DEFAULT_COLORS, Renderer
+
+
+class CanvasRenderer(Renderer):
+    """
+    Draws a MazeBoard on a Tk canvas with one rectangle item per cell. The
+    items are created once, then every draw() only recolors the cells changed
+    through set_cell since the previous one.
+    """
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        board: MazeBoard,
+        cell_size: int,
+        colors: dict[CellMark, str] = None,
+    ):
+        self.canvas = canvas
+        self.cell_size = cell_size
+        self.colors = {**DEFAULT_COLORS, **(colors or {})}
+
+        # Item id of every cell, by flat cell index
+        self.items = array("l")
+        for row in range(board.height):
+            for col in range(board.width):
+                x0, y0 = col * cell_size, row * cell_size
+                x1, y1 = x0 + cell_size, y0 + cell_size
+                self.items.append(canvas.create_rectangle(x0, y0, x1, y1))
+
+        self.set_board(board)
+
+    def _fits(self, board: MazeBoard) -> bool:
+        # Boards of the same size reuse the canvas items
+        return len(self.items) == board.height * board.width
+
+    def _draw_whole(self):
+        self._recolor(range(len(self.items)))
+
+    def draw(self):
+        """Recolors the cells changed since the last draw"""
+        self._recolor(self.board.take_changes())
+
+    def _recolor(self, indices):
+        board = self.board
+        width = board.width
+        colors = self.colors
+        itemconfig = self.canvas.itemconfigure
+        for index in indices:
+            row, col = divmod(index, width)
+            itemconfig(self.items[index], fill=colors[board.get_cell(row, col)])
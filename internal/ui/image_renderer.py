@@ -0,0 +1,79 @@
+import tkinter as tk
+
+import numpy as np
+
+from internal.maze.maze import MazeBoard, CellMark
+from .renderer import DEFAULT_COLORS, Renderer
+
+
+class ImageRenderer(Renderer):
+    """
+    Draws a MazeBoard on a Tk canvas as a single PhotoImage, every cell being
+    a square of cell_size pixels. Pixel rows are built from the cells with a
+    palette lookup, so a frame costs one put() of the band of rows holding
+    the cells changed since the previous one, whatever their number.
+    Same interface as CanvasRenderer.
+    """
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        board: MazeBoard,
+        cell_size: int,
+        colors: dict[CellMark, str] = None,
+    ):
+        self.canvas = canvas
+        self.cell_size = cell_size
+
+        # Pixel data of every CellMark: its "#rrggbb " color repeated over the
+        # width of a cell, for put() to read rows as lists of colors
+        colors = {**DEFAULT_COLORS, **(colors or {})}
+        self.palette = np.zeros((256, 8 * cell_size), dtype=np.uint8)
+        for mark, color in colors.items():
+            red, green, blue = (value >> 8 for value in canvas.winfo_rgb(color))
+            pixel = f"#{red:02x}{green:02x}{blue:02x} ".encode()
+            self.palette[mark] = np.frombuffer(pixel * cell_size, dtype=np.uint8)
+
+        self.image = tk.PhotoImage(
+            width=board.width * cell_size, height=board.height * cell_size
+        )
+        canvas.create_image(0, 0, anchor=tk.NW, image=self.image)
+
+        self.set_board(board)
+
+    def _fits(self, board: MazeBoard) -> bool:
+        return (board.width * self.cell_size, board.height * self.cell_size) == (
+            self.image.width(),
+            self.image.height(),
+        )
+
+    def _draw_whole(self):
+        self._put_rows(0, self.board.height)
+
+    def draw(self):
+        """Redraws the band of rows holding the cells changed since the last draw"""
+        changed = self.board.take_changes()
+        if not changed:
+            return
+        width = self.board.width
+        self._put_rows(min(changed) // width, max(changed) // width + 1)
+
+    def _put_rows(self, top: int, bottom: int):
+        cells = np.stack(
+            [
+                np.frombuffer(self.board.get_row(row), dtype=np.uint8)
+                for row in range(top, bottom)
+            ]
+        )
+
+        # One "{color color ...}" list per row of pixels, every cell row being
+        # repeated over the height of a cell
+        pixels = self.palette[cells].reshape(bottom - top, -1)
+        rows = np.empty((bottom - top, pixels.shape[1] + 3), dtype=np.uint8)
+        rows[:, 0] = ord("{")
+        rows[:, 1:-2] = pixels
+        rows[:, -2] = ord("}")
+        rows[:, -1] = ord(" ")
+        rows = np.repeat(rows, self.cell_size, axis=0)
+
+        self.image.put(rows.tobytes().decode("ascii"), to=(0, top * self.cell_size))
@@ -0,0 +1,44 @@
+from internal.maze.maze import MazeBoard, CellMark
+
+# Fill of every CellMark, renderers can be given their own
+DEFAULT_COLORS = {
+    CellMark.EMPTY: "white",
+    CellMark.WALL: "black",
+    CellMark.PATH: "green",
+    CellMark.SCANNED: "light blue",
+    CellMark.START: "blue",
+    CellMark.END: "red",
+}
+
+
+class Renderer:
+    """
+    Draws a MazeBoard, every draw() only redrawing the cells changed through
+    set_cell since the previous one. A board feeds a single renderer.
+    Subclasses implement draw(), _fits() and _draw_whole().
+    """
+
+    board: MazeBoard = None
+
+    def set_board(self, board: MazeBoard):
+        """Shows another board of the same size, drawing it whole once"""
+        if not self._fits(board):
+            raise ValueError("Board doesn't have the size of the rendered one")
+        if self.board is not None:
+            # Changes to the previous board won't be drawn anymore
+            self.board.dirty = None
+        self.board = board
+        board.track_changes()
+        board.take_changes()
+        self._draw_whole()
+
+    def draw(self):
+        """Redraws the cells changed since the last draw"""
+        raise NotImplementedError("Subclasses should implement draw()")
+
+    def _fits(self, board: MazeBoard) -> bool:
+        """Whether the board has the size this renderer draws"""
+        raise NotImplementedError("Subclasses should implement _fits()")
+
+    def _draw_whole(self):
+        raise NotImplementedError("Subclasses should implement _draw_whole()")
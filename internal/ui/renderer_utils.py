@@ -0,0 +1,23 @@
+from .canvas_renderer import CanvasRenderer
+from .image_renderer import ImageRenderer
+from enum import StrEnum
+from tkinter import Canvas
+from ..maze.maze import MazeBoard, CellMark
+
+
+class RendererType(StrEnum):
+    CANVAS = "canvas"  # One canvas item per cell, for small boards
+    IMAGE = "image"  # A single image, for boards of any size
+
+
+def RendererFromType(
+    rType: RendererType,
+    canvas: Canvas,
+    board: MazeBoard,
+    cell_size: int,
+    colors: dict[CellMark, str] = None,
+):
+    if rType == RendererType.CANVAS:
+        return CanvasRenderer(canvas, board, cell_size, colors)
+    elif rType == RendererType.IMAGE:
+        return ImageRenderer(canvas, board, cell_size, colors)
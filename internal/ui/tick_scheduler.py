@@ -0,0 +1,119 @@
+import time
+import tkinter as tk
+from typing import Callable
+
+
+class TickScheduler:
+    """
+    Runs a step-by-step algorithm from the Tk event loop, decoupling its speed
+    from the cost of drawing it. Every frame runs as many ticks as fit in the
+    frame budget of the target FPS, then draws once.
+
+    In max speed mode ticks run back to back and the board is only drawn
+    every `render_every` milliseconds, Tk just getting the time to process
+    its events in between.
+
+    `tick` returns True once the algorithm is done, as Solver.solve_tick()
+    does. `ticks_per_frame` caps the ticks of a frame to watch it slowly.
+    Ticks can call pause() to hold the next frame without blocking Tk, and
+    report_steps() when a single call runs many steps of the algorithm.
+    """
+
+    def __init__(
+        self,
+        root: tk.Tk,
+        tick: Callable[[], bool],
+        draw: Callable[[], None],
+        fps: int = 30,
+        max_speed: bool = False,
+        render_every: int = 250,
+        ticks_per_frame: int = None,
+        on_done: Callable[[], None] = None,
+    ):
+        self.root = root
+        self.tick = tick
+        self.draw = draw
+        self.fps = fps
+        self.max_speed = max_speed
+        self.render_every = render_every
+        self.ticks_per_frame = ticks_per_frame
+        self.on_done = on_done
+
+        self.done = False
+        self.total_ticks = 0
+        # Stats of the last frames, smoothed
+        self.ticks_per_second = 0.0
+        self.frame_time = 0.0  # Seconds spent ticking and drawing a frame
+        self.draw_time = 0.0  # Seconds spent drawing a frame
+        self._last_frame = None
+        self._pause = None
+        self._steps = 0
+
+    def start(self):
+        self._last_frame = time.perf_counter()
+        self.root.after(0, self._frame)
+
+    def pause(self, milliseconds: int):
+        """Ends the current frame after this tick and waits before the next one"""
+        self._pause = milliseconds
+
+    def report_steps(self, count: int):
+        """Counts `count` steps for the ticks/s, instead of the tick call itself"""
+        self._steps += count
+
+    def stats_text(self) -> str:
+        return f"{self.ticks_per_second:,.0f} ticks/s  {self.frame_time * 1000:.1f} ms/frame"
+
+    def _budget(self) -> float:
+        """Seconds of ticking in a frame"""
+        if self.max_speed:
+            return self.render_every / 1000
+        # Whatever the last draw left of the frame, yet always a bit
+        return max(1 / self.fps - self.draw_time, 0.001)
+
+    def _frame(self):
+        start = time.perf_counter()
+        deadline = start + self._budget()
+        limit = self.ticks_per_frame
+
+        ticks = 0
+        self._steps = 0
+        while not self.done:
+            self.done = self.tick()
+            ticks += 1
+            if limit is not None and ticks >= limit:
+                break
+            if self._pause is not None or time.perf_counter() >= deadline:
+                break
+
+        drawing = time.perf_counter()
+        self.draw()
+        end = time.perf_counter()
+
+        steps = self._steps or ticks
+        self.total_ticks += steps
+        elapsed = max(end - self._last_frame, 1e-9)
+        self._last_frame = end
+        self.ticks_per_second = self._smooth(self.ticks_per_second, steps / elapsed)
+        self.frame_time = self._smooth(self.frame_time, end - start)
+        self.draw_time = self._smooth(self.draw_time, end - drawing)
+
+        if self.done:
+            if self.on_done is not None:
+                self.on_done()
+            return
+
+        if self._pause is not None:
+            delay = self._pause
+            self._pause = None
+            # The pause is not counted as time spent ticking
+            self._last_frame = time.perf_counter() + delay / 1000
+        elif self.max_speed:
+            delay = 1
+        else:
+            delay = max(int((1 / self.fps - (end - start)) * 1000), 1)
+        self.root.after(delay, self._frame)
+
+    @staticmethod
+    def _smooth(average: float, value: float) -> float:
+        return value if average == 0 else average * 0.8 + value * 0.2
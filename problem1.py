@@ -1,10 +1,13 @@
 import tkinter as tk
 from internal.maze.maze import MazeBoard, CellMark, get_random_start_goal
 from internal.maze.generators import Generator, PrimsGenerator, BorubskaGenerator
+from internal.ui.renderer_utils import RendererType, RendererFromType
+from internal.ui.tick_scheduler import TickScheduler
 
 class MazeUI:
     CELL_SIZE = 5
-    DELAY = 1  # milliseconds
+    FPS = 30  # As many ticks run per frame as fit in its time
+    RENDERER = RendererType.IMAGE  # CANVAS draws every cell as its own item
 
     def __init__(self, root: tk.Tk, generator: Generator, x_offset: int, y_offset: int, label: str):
         """
@@ -29,33 +32,38 @@ class MazeUI:
         self.label = tk.Label(root, text=label, font=("Helvetica", 10))
         self.label.place(x=x_offset + canvas_width // 2 - 20, y=y_offset + canvas_height + 5)
 
+        # Board kept up to date with the passages carved on every tick, only
+        # the carved cells are redrawn
+        self.maze_board: MazeBoard = self.generator.blank_maze()
+        self.renderer = RendererFromType(
+            self.RENDERER, self.canvas, self.maze_board, self.CELL_SIZE
+        )
+
+        self.scheduler = TickScheduler(
+            root, self.generate_tick, self.draw_maze, fps=self.FPS, on_done=self.finished
+        )
+
         self.draw_maze()
         self.animate()
 
     def draw_maze(self):
-        """Draws the maze on the canvas."""
-        maze_board: MazeBoard = self.generator.to_maze()
-        self.canvas.delete("all")
-
-        for row in range(maze_board.height):
-            for col in range(maze_board.width):
-                x0, y0 = col * self.CELL_SIZE, row * self.CELL_SIZE
-                x1, y1 = x0 + self.CELL_SIZE, y0 + self.CELL_SIZE
+        """Draws the cells changed since the last draw on the canvas."""
+        self.renderer.draw()
 
-                if maze_board.get_cell(row, col) == CellMark.WALL:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill="black")
-                elif maze_board.get_cell(row, col) == CellMark.EMPTY:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill="white")
-
-        self.root.update()
+    def generate_tick(self) -> bool:
+        """One generation step, returns True once the maze is finished."""
+        if not self.generator.generate_tick():
+            return True
+        # Apply what the tick carved, drawn with the next frame
+        self.generator.update_maze(self.maze_board)
+        return False
 
     def animate(self):
-        """Runs the maze generation step by step."""
-        if self.generator.generate_tick():  # Generate step-by-step
-            self.draw_maze()  # Redraw the maze after a tick
-            self.root.after(self.DELAY, self.animate)  # Continue animation
-        else:
-            print(f"{self.label.cget('text')} Maze generation finished.")
+        """Runs the maze generation, drawing it once per frame."""
+        self.scheduler.start()
+
+    def finished(self):
+        print(f"{self.label.cget('text')} Maze generation finished.")
 
 
 # ---------- MAIN ----------
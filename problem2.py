@@ -2,14 +2,20 @@ import tkinter as tk
 import heapq
 from enum import StrEnum
 from internal.maze.maze import MazeBoard, CellMark, get_random_start_goal
-from internal.maze.generators import get_generator, GeneratorType
+from internal.maze.generators import GeneratorType
+from internal.maze.cache import MazeCache
 from internal.solver.solver import Solver
 from internal.solver.solver_utils import SolverType, SolverFromType
+from internal.ui.renderer_utils import RendererType, RendererFromType
+from internal.ui.tick_scheduler import TickScheduler
 
 
 class MazeUI:
     CELL_SIZE = 5
-    DELAY = 1
+    FPS = 30  # As many ticks run per frame as fit in its time
+    MAX_SPEED = False  # Tick nonstop and only draw every RENDER_EVERY ms
+    RENDER_EVERY = 250
+    RENDERER = RendererType.IMAGE  # CANVAS draws every cell as its own item
 
     def __init__(
         self,
@@ -51,6 +57,9 @@ class MazeUI:
         self.nodes_explored_label = tk.Label(self.stats_frame, text="Nodes Explored: 0")
         self.nodes_explored_label.pack(side=tk.LEFT, padx=5)
 
+        self.speed_label = tk.Label(self.stats_frame, text="")
+        self.speed_label.pack(side=tk.LEFT, padx=5)
+
         start_row, start_col = 1, 1
 
         goal_row, goal_col = self.board.height - 2, self.board.width - 2
@@ -84,63 +93,54 @@ class MazeUI:
 
         self.solver = SolverFromType(solver_type, self.board, start_index, goal_index)
 
+        # Only the cells the solver marks are redrawn
+        self.renderer = RendererFromType(
+            self.RENDERER, self.canvas, self.board, self.CELL_SIZE
+        )
+
+        self.scheduler = TickScheduler(
+            root,
+            self.solver.solve_tick,
+            self.draw_maze,
+            fps=self.FPS,
+            max_speed=self.MAX_SPEED,
+            render_every=self.RENDER_EVERY,
+            on_done=self.finished,
+        )
+
         self.draw_maze()
 
         self.animate()
 
     def draw_maze(self):
         """Draws the current state of the maze on the canvas."""
-        self.canvas.delete("all")
-
-        for row in range(self.board.height):
-            for col in range(self.board.width):
-                x0, y0 = col * self.CELL_SIZE, row * self.CELL_SIZE
-                x1, y1 = x0 + self.CELL_SIZE, y0 + self.CELL_SIZE
-
-                cell = self.board.get_cell(row, col)
-
-                if cell == CellMark.WALL:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill="black")
-                elif cell == CellMark.EMPTY:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill="white")
-                elif cell == CellMark.PATH:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill="green")
-                elif cell == CellMark.SCANNED:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill="light blue")
-                elif cell == CellMark.START:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill="blue")
-                elif cell == CellMark.END:
-                    self.canvas.create_rectangle(x0, y0, x1, y1, fill="red")
+        self.renderer.draw()
 
         path_length = len(self.solver.get_solution_path())
         nodes_explored = self.solver.get_scanned_tiles()
 
         self.path_length_label.config(text=f"Longitud: {path_length}")
         self.nodes_explored_label.config(text=f"Nodod explorados: {nodes_explored}")
-
-        self.root.update()
+        self.speed_label.config(text=self.scheduler.stats_text())
 
     def animate(self):
-        """Runs the maze solving step by step."""
-        if not self.solver.solve_tick():
-            self.draw_maze()
-            self.root.after(self.DELAY, self.animate)
-        else:
-            self.draw_maze()
-            print(f"{self.label.cget('text')} Laberinto terinado.")
-            print(f"Longitud: {len(self.solver.get_solution_path())}")
-            print(f"Nodos explorados: {self.solver.get_scanned_tiles()}")
+        """Runs the maze solving, drawing it once per frame."""
+        self.scheduler.start()
+
+    def finished(self):
+        print(f"{self.label.cget('text')} Laberinto terinado.")
+        print(f"Longitud: {len(self.solver.get_solution_path())}")
+        print(f"Nodos explorados: {self.solver.get_scanned_tiles()}")
 
 
 # ---------- MAIN ----------
 if __name__ == "__main__":
     print(" ==== RESOLVIENDO LABERINTO ===== ")
 
-    width, height = 60, 80
+    width, height, seed = 60, 80, 0
 
-    generator = get_generator(GeneratorType.PRIM, height, width)
-    generator.generate()
-    maze = generator.to_maze()
+    # The maze of a seed is only generated on the first run
+    maze = MazeCache().get(GeneratorType.PRIM, height, width, seed)
 
     root = tk.Tk()
     root.title("Maze Solver Animation")
@@ -1,27 +1,34 @@
 import tkinter as tk
+import random
 import sys
-import time
 
 from tkinter import Scrollbar, RIGHT, Y
 from threading import Lock
-from internal.maze.maze import MazeBoard, CellMark, get_random_start_goal
-from internal.maze.generators import Generator, PrimsGenerator, BorubskaGenerator
+from internal.maze.maze import MazeBoard, MazeOverlay, CellMark
+from internal.maze.generators import GeneratorType
+from internal.maze.cache import MazeCache
+from internal.experiments.runner import run_experiments
+from internal.experiments.results import ResultsWriter
 from internal.solver.solver import Solver
 from internal.solver.A_Star import A_Star
 from internal.solver.BFS import BFS
 from internal.solver.DFS import DFS
 from internal.solver.Dijikstra import Dijikstra
 from internal.solver.solver_utils import SolverType, SolverFromType
+from internal.ui.renderer_utils import RendererType, RendererFromType
+from internal.ui.tick_scheduler import TickScheduler
 from random import randint
 
 
-sys.setrecursionlimit(15000)
-
-
 class WholeUI:
     CELL_SIZE = 10
     PAUSE_SECS = 2
-    DELAY = 5  # milliseconds
+    TICKS_PER_ROUND = 64  # Ticks every solver runs per round, all going at the same pace
+    COLORS = {CellMark.SCANNED: "skyblue", CellMark.PATH: "brown"}
+    RENDERER = RendererType.IMAGE  # CANVAS draws every cell as its own item
+    FPS = 30  # As many ticks run per frame as fit in its time
+    MAX_SPEED = False  # Tick nonstop and only draw every RENDER_EVERY ms
+    RENDER_EVERY = 250
 
     def __init__(
         self,
@@ -46,9 +53,10 @@ class WholeUI:
         self.solversType = solvers
         self.doneSolversType = []
 
+        # Solvers of an experiment share the maze, each marks its own overlay
         self.boards_per_player = {}
         for sType in solvers:
-            self.boards_per_player[sType] = [MazeBoard.copy_from(m) for m in mazes]
+            self.boards_per_player[sType] = [MazeOverlay(m) for m in mazes]
             # self.board_per_solver[sType] = [m for m in mazes]
 
         self.solvers = {
@@ -66,6 +74,7 @@ class WholeUI:
         }
 
         self.solvers_canvas = {}
+        self.renderers = {}
         for i in range(len(solvers)):
             x_offset = 10
             if i % 2 != 0:
@@ -76,6 +85,14 @@ class WholeUI:
             cv = tk.Canvas(root, width=canvas_width, height=canvas_height)
             cv.place(x=x_offset, y=y_offset)
             self.solvers_canvas[solvers[i]] = cv
+            # Redraws the cells of the board as the solver marks them
+            self.renderers[solvers[i]] = RendererFromType(
+                self.RENDERER,
+                cv,
+                self.boards_per_player[solvers[i]][0],
+                self.CELL_SIZE,
+                self.COLORS,
+            )
 
             label = tk.Label(root, text=solvers[i], font=("Helvetica", 10))
             label.place(
@@ -120,6 +137,20 @@ class WholeUI:
             ent.place(x=x, y=y)
         self.exp_table_entries = {k: v for (k, v) in zip(solvers, entries)}
 
+        # Ticks per second and frame time
+        self.speed_label = tk.Label(root, text="", font=("Helvetica", 12))
+        y += 60
+        self.speed_label.place(x=x, y=y)
+
+        self.scheduler = TickScheduler(
+            root,
+            self.tick,
+            self.draw_ui,
+            fps=self.FPS,
+            max_speed=self.MAX_SPEED,
+            render_every=self.RENDER_EVERY,
+        )
+
         self.draw_ui()
         self.animate()
 
@@ -130,28 +161,10 @@ class WholeUI:
 
         for sType in self.solvers:
             maze_board: MazeBoard = self.boards_per_player[sType][currentIdx]
-            canvas: tk.Canvas = self.solvers_canvas[sType]
-            canvas.delete("all")
-
-            for row in range(maze_board.height):
-                for col in range(maze_board.width):
-                    x0, y0 = col * self.CELL_SIZE, row * self.CELL_SIZE
-                    x1, y1 = x0 + self.CELL_SIZE, y0 + self.CELL_SIZE
-
-                    cell = maze_board.get_cell(row, col)
-
-                    if cell == CellMark.WALL:
-                        canvas.create_rectangle(x0, y0, x1, y1, fill="black")
-                    elif cell == CellMark.EMPTY:
-                        canvas.create_rectangle(x0, y0, x1, y1, fill="white")
-                    elif cell == CellMark.SCANNED:
-                        canvas.create_rectangle(x0, y0, x1, y1, fill="skyblue")
-                    elif cell == CellMark.PATH:
-                        canvas.create_rectangle(x0, y0, x1, y1, fill="brown")
-                    elif cell == CellMark.START:
-                        canvas.create_rectangle(x0, y0, x1, y1, fill="blue")
-                    elif cell == CellMark.END:
-                        canvas.create_rectangle(x0, y0, x1, y1, fill="red")
+            renderer = self.renderers[sType]
+            if renderer.board is not maze_board:
+                renderer.set_board(maze_board)
+            renderer.draw()
 
         for header in self.exp_table:
             row = self.exp_table[header]
@@ -163,105 +176,163 @@ class WholeUI:
             entry = self.avg_table_entries[header]
             entry.config(text=f"{header}\t{row}")
 
-        self.root.update()
+        self.speed_label.config(text=self.scheduler.stats_text())
 
     def reached_end_experiments(self) -> bool:
-        return self.current_experiment < 0 and self.current_experiment >= len(
-            self.mazes
-        )
+        return self.current_experiment >= len(self.mazes)
 
     def animate(self):
-        # Done animating this current experiment
-        allDoneExperiment = len(self.doneSolversType) == len(self.solvers.keys())
-        if allDoneExperiment:
-            if self.reached_end_experiments():
-                return
+        """Runs the experiments, drawing them once per frame"""
+        self.scheduler.start()
 
-        if allDoneExperiment:
-            print("ALL COMPLETED!")
-            time.sleep(self.PAUSE_SECS)
-            self.doneSolversType = []
-            self.current_experiment += 1
+    def next_experiment(self):
+        """Moves every solver to the maze of the next experiment, if any"""
+        self.doneSolversType = []
+        self.current_experiment += 1
+        if self.reached_end_experiments():
+            return
+
+        print("Changing board and solvers!")
+        for sType in self.solvers:
+            next_board = self.boards_per_player[sType][self.current_experiment]
+            self.solvers[sType] = SolverFromType(
+                sType,
+                next_board,
+                next_board.cords_as_cell(next_board.start),
+                next_board.cords_as_cell(next_board.end),
+            )
+
+    def tick(self) -> bool:
+        """
+        Runs a round of the race: every solver still racing gets the same
+        number of ticks, so the first to finish is the one needing the
+        fewest. Returns True once every experiment is done.
+        """
+        # Done animating this current experiment, after its pause
+        if len(self.doneSolversType) == len(self.solvers):
+            self.next_experiment()
             if self.reached_end_experiments():
-                return
-            else:
-                print("Changing board and solvers!")
-                for sType in self.solvers:
-                    next_board = self.boards_per_player[sType][self.current_experiment]
-                    self.solvers[sType] = SolverFromType(
-                        sType,
-                        next_board,
-                        next_board.cords_as_cell(next_board.start),
-                        next_board.cords_as_cell(next_board.end),
-                    )
+                return True
 
+        steps = 0
+        finishing = []  # (ticks taken, solver) of the solvers done this round
         for sType in self.solvers:
-            solver: Solver = self.solvers[sType]
-            solverBoard: MazeBoard = self.boards_per_player[sType][
-                self.current_experiment % len(self.solversType)
-            ]
+            # Solvers done wait for the others to complete
+            if sType in self.doneSolversType:
+                continue
 
-            doneButOthersAreNot = (
-                len(self.doneSolversType) != len(self.solversType)
-                and sType in self.doneSolversType
-            )
+            solver: Solver = self.solvers[sType]
+            solverBoard: MazeBoard = self.boards_per_player[sType][self.current_experiment]
 
-            if doneButOthersAreNot:
-                print(
-                    sType,
-                    "Done! But others haven't completed!",
-                    self.doneSolversType,
-                    self.solversType,
-                )
-            else:  # Normal tick
+            solved_laberinth = False
+            ticks = 0
+            while not solved_laberinth and ticks < self.TICKS_PER_ROUND:
                 solved_laberinth = solver.solve_tick()
+                ticks += 1
+            steps += ticks
+
+            self.exp_table[sType] = [
+                solverBoard.distance,
+                solver.get_scanned_tiles(),
+                -1,
+                self.current_experiment + 1,
+            ]
 
-                self.exp_table[sType] = [
-                    solverBoard.distance,
-                    solver.get_scanned_tiles(),
-                    -1,
-                    self.current_experiment + 1,
-                ]
-
-                if solved_laberinth and sType not in self.doneSolversType:
-                    self.doneSolversType.append(sType)
-                    finishPosition = len(self.doneSolversType)
-                    self.exp_table[sType][2] = finishPosition
-                    self.avg_table[sType] += (
-                        finishPosition - self.avg_table[sType]
-                    ) / (self.current_experiment + 1)
+            if solved_laberinth:
+                finishing.append((ticks, sType))
 
-        self.draw_ui()  # Redraw the maze after a tick
-        self.root.after(self.DELAY, self.animate)
+        # Solvers done in the same round are placed by the ticks they took in
+        # it, not by their order in the list; equal ticks share the place
+        done_before = len(self.doneSolversType)
+        for ticks, sType in sorted(finishing, key=lambda entry: entry[0]):
+            self.doneSolversType.append(sType)
+            finishPosition = done_before + 1 + sum(other < ticks for other, _ in finishing)
+            self.exp_table[sType][2] = finishPosition
+            self.avg_table[sType] += (
+                finishPosition - self.avg_table[sType]
+            ) / (self.current_experiment + 1)
 
+        self.scheduler.report_steps(steps)
 
-def generate_random_board(generator: Generator) -> MazeBoard:
-    board = generator.generate()
-    get_random_start_goal(board, 10)
-    return board
+        if len(self.doneSolversType) == len(self.solvers):
+            print("ALL COMPLETED!")
+            # Keeps the finished experiment on screen, Tk still running
+            self.scheduler.pause(int(self.PAUSE_SECS * 1000))
+
+        return False
+
+
+def run_headless(generatorType, height, width, experimentCount, seed, solvers):
+    """
+    Runs the experiments without the UI, every (maze, solver) pair on its own
+    core, printing the results of each experiment as soon as it is done.
+    Every run is saved to the results directory as well. Solvers run twice,
+    the second time traced for their peak memory, which takes at least as
+    long again as the timed runs.
+    """
+    avg_table = {sType: 0 for sType in solvers}
+    print("ALG\tDIST\tEXPAN\tPLACE\t#EXP")
+    runs_per_experiment = run_experiments(
+        generatorType, height, width, experimentCount, solvers, seed, min_distance=10
+    )
+    with ResultsWriter() as results:
+        for done, runs in enumerate(runs_per_experiment, 1):
+            results.extend(runs)
+            for run in runs:
+                avg_table[run.solver] += (run.place - avg_table[run.solver]) / done
+                row = [run.distance, run.expansions, run.place, run.experiment + 1]
+                print(f"{run.solver}\t" + "\t".join(map(str, row)))
+
+    print("ALG\tAVG PLACE")
+    for sType, avg in avg_table.items():
+        print(f"{sType}\t{avg}")
+    print("Runs saved to", results.path)
 
 
 # ---------- MAIN ----------
 if __name__ == "__main__":
+    # python problem3.py --headless < p3Input
+    headless = "--headless" in sys.argv[1:]
+
     print(" ==== MAZE GENERATION ===== ")
     width = int(input("Width: "))
     height = int(input("Height: "))
 
     # Generators
     genInput = input("Borubska/Prims (b/p): ")
-    generator = PrimsGenerator(width, height)
+    generatorType = GeneratorType.PRIM
     if genInput == "b":
-        generator = BorubskaGenerator(width, height)
+        generatorType = GeneratorType.BORUBSKA
 
     experimentCount = int(input("Experiment count: "))
-    mazes = [generate_random_board(generator) for _ in range(experimentCount)]
+    try:
+        seedInput = input("Seed (empty for a random one): ")
+    except EOFError:
+        # Inputs files from before the seed was asked, like p3Input
+        seedInput = ""
+    seed = int(seedInput) if seedInput else random.SystemRandom().getrandbits(64)
+    print("Corpus seed:", seed)
+
+    solvers = [SolverType.BFS, SolverType.DFS, SolverType.DIJIKSTRA, SolverType.A_STAR]
+    # solvers = [SolverType.DFS, SolverType.A_STAR]
+    if headless:
+        run_headless(generatorType, height, width, experimentCount, seed, solvers)
+        sys.exit()
+
+    # Every maze gets its own seed, mazes of a seed already run are loaded
+    # from the cache and the others are built across all cores
+    mazes = [None] * experimentCount
+    for index, board in MazeCache().get_batch(
+        generatorType, height, width, experimentCount, seed, min_distance=10
+    ):
+        mazes[index] = board
 
     # Initialize Tkinter root window
     root = tk.Tk()
     root.title("Maze solvers comparison")
 
-    maze_width = ((generator.width * 2) + 1) * WholeUI.CELL_SIZE
-    maze_height = ((generator.height * 2) + 1) * WholeUI.CELL_SIZE
+    maze_width = mazes[0].width * WholeUI.CELL_SIZE
+    maze_height = mazes[0].height * WholeUI.CELL_SIZE
 
     # Set the window size dynamically to fit both canvases vertically
     window_width = maze_width + 20
@@ -269,8 +340,6 @@ if __name__ == "__main__":
     root.geometry(f"{window_width}x{window_height}")
 
     # Create two independent UI instances, one besides the other
-    solvers = [SolverType.BFS, SolverType.DFS, SolverType.DIJIKSTRA, SolverType.A_STAR]
-    # solvers = [SolverType.DFS, SolverType.A_STAR]
     WholeUI(root, mazes, solvers, maze_width, maze_height, 10, 10)
 
     v = Scrollbar(root)